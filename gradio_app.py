@@ -4,83 +4,164 @@ Gradio Web App for Vector Addition Calculator
 Supports matplotlib plots with animations
 """
 
+import threading
+
 import gradio as gr
+import matplotlib
+matplotlib.use('Agg')  # Headless rendering; never pick an interactive backend
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 from matplotlib.figure import Figure
 import numpy as np
 from vector_addition import (
-    add_vectors, ColorTheme, draw_vector_with_labels, draw_angle_arc,
+    add_vectors, ColorTheme, draw_vector_with_labels, arc_geometry,
     generate_solution_text, PADDING_RATIO, MIN_NEGATIVE_SPACE_RATIO,
-    ARC_F1_RADIUS_RATIO, ARC_F2_RADIUS_RATIO, ARC_FR_RADIUS_RATIO
+    ARC_F1_RADIUS_RATIO, ARC_F2_RADIUS_RATIO, ARC_FR_RADIUS_RATIO,
+    ZERO_THRESHOLD
 )
 
+# Reuse a single Figure/Axes across clicks: figure construction is the
+# dominant matplotlib cost per render, and allocating a new (never-closed)
+# figure per click leaks memory over a long-running Gradio session.
+# Gradio may serve requests concurrently, so renders are serialized.
+_PLOT_LOCK = threading.Lock()
+_FIG = Figure(figsize=(10, 8), dpi=100)
+_AX = _FIG.add_subplot(111)
+# Fixed margins set once: a single-subplot figure does not need the
+# tight_layout constraint solve that used to run on every render
+_FIG.subplots_adjust(left=0.08, right=0.98, top=0.94, bottom=0.08)
+# Persistent artist handles, populated on the first render and then updated
+# in place via set_data/set_UVC/set_text - rebuilding Line2D/Text artists
+# from scratch is a large share of matplotlib's per-render cost.
+_ARTISTS = {}
+# Repeated clicks with unchanged inputs are common; remember the last inputs
+# and hand back the previous triple without re-rendering. Only one entry is
+# possible because every render mutates the shared figure, so older cached
+# figures would silently show the latest render.
+_LAST_INPUTS = None
+_LAST_OUTPUTS = None
+
 def create_vector_plot(scale, f1_mag, f1_angle, f2_mag, f2_angle, show_solution):
     """Create matplotlib plot and optional solution text"""
+    global _LAST_INPUTS, _LAST_OUTPUTS
+    inputs = (scale, f1_mag, f1_angle, f2_mag, f2_angle, show_solution)
+    with _PLOT_LOCK:
+        if inputs == _LAST_INPUTS:
+            return _LAST_OUTPUTS
+        outputs = _render_vector_plot(scale, f1_mag, f1_angle, f2_mag, f2_angle, show_solution)
+        _LAST_INPUTS, _LAST_OUTPUTS = inputs, outputs
+        return outputs
+
+def _render_vector_plot(scale, f1_mag, f1_angle, f2_mag, f2_angle, show_solution):
+    """Render into the shared figure; caller must hold _PLOT_LOCK."""
     try:
         # Calculate vectors
         f1, f2, r = add_vectors(f1_mag, f1_angle, f2_mag, f2_angle)
         theme = ColorTheme.ocean_theme()
-        
-        # Create figure
-        fig = Figure(figsize=(10, 8), dpi=100, facecolor=theme.background_color)
-        ax = fig.add_subplot(111, facecolor=theme.background_color)
-        
-        # Calculate max value
-        max_val = max(abs(f1.x), abs(f1.y), abs(f2.x), abs(f2.y), abs(r.x), abs(r.y))
-        
+
+        # Reuse the shared figure
+        fig, ax = _FIG, _AX
+
+        # One-time setup of static chrome and artist slots; subsequent
+        # renders only mutate artist data instead of rebuilding the Axes
+        if not _ARTISTS:
+            # Drop anything a previous error render left behind (e.g. the
+            # centred "Error: ..." text) before rebuilding the chrome
+            ax.clear()
+            fig.set_facecolor(theme.background_color)
+            ax.set_facecolor(theme.background_color)
+            ax.set_aspect('equal')
+            ax.grid(True, alpha=0.3, color=theme.grid_color, linestyle='-', linewidth=0.5)
+            ax.axhline(y=0, color=theme.grid_color, linewidth=1.5, zorder=2)
+            ax.axvline(x=0, color=theme.grid_color, linewidth=1.5, zorder=2)
+            ax.set_xlabel('Fₓ (N)', fontsize=11, color=theme.text_color, fontweight='600')
+            ax.set_ylabel('Fᵧ (N)', fontsize=11, color=theme.text_color, fontweight='600')
+            ax.set_title('Vector Addition Visualization', fontsize=13, fontweight='bold',
+                        color=theme.text_color, pad=15)
+            ax.tick_params(colors=theme.text_color)
+            _ARTISTS['construction_a'], = ax.plot([], [], color='#FF6B6B', linestyle='--',
+                                                  linewidth=1.5, alpha=0.4)
+            _ARTISTS['construction_b'], = ax.plot([], [], color='#5B8DEE', linestyle='--',
+                                                  linewidth=1.5, alpha=0.4)
+            # The three angle arcs (F1, F2, FR) share one LineCollection;
+            # a single collection is much cheaper than three Line2D artists
+            _ARTISTS['arcs'] = LineCollection([], colors=('#5B8DEE', '#FF6B6B', '#28A745'),
+                                              linewidths=(2, 2, 2.5), zorder=6)
+            ax.add_collection(_ARTISTS['arcs'])
+            _ARTISTS['arc_label_f1'] = ax.text(0, 0, '', fontsize=11, color='#5B8DEE',
+                                               fontweight='bold', ha='center', va='center', zorder=12)
+            _ARTISTS['arc_label_f2'] = ax.text(0, 0, '', fontsize=11, color='#FF6B6B',
+                                               fontweight='bold', ha='center', va='center', zorder=12)
+            _ARTISTS['arc_label_r'] = ax.text(0, 0, '', fontsize=12, color='black',
+                                              fontweight='bold', ha='center', va='center', zorder=12,
+                                              bbox=dict(boxstyle='round,pad=0.25', facecolor='none',
+                                                        edgecolor='#28A745', linewidth=1.5))
+            _ARTISTS['arc_marker_r'], = ax.plot([], [], 'o', color='#28A745', markersize=4,
+                                                zorder=13, markeredgecolor='white',
+                                                markeredgewidth=1.2)
+            for key in ('f1', 'f2', 'r'):
+                _ARTISTS[key] = {}
+
+        # Calculate max value with one vectorized reduction over the
+        # component matrix (rows F1/F2/R, columns x/y)
+        coords = np.array([[f1.x, f1.y], [f2.x, f2.y], [r.x, r.y]])
+        max_val = np.abs(coords).max()
+
         # Draw vectors
         f1_cm = f1.mag / scale
         f2_cm = f2.mag / scale
         r_cm = r.mag / scale
-        
+
         draw_vector_with_labels(ax, 0, 0, f1.x, f1.y, '#5B8DEE', 'F₁',
-                               f1.mag, f1.angle, f1_cm, max_val, theme=theme)
+                               f1.mag, f1.angle, f1_cm, max_val, theme=theme,
+                               artists=_ARTISTS['f1'])
         draw_vector_with_labels(ax, 0, 0, f2.x, f2.y, '#FF6B6B', 'F₂',
-                               f2.mag, f2.angle, f2_cm, max_val, theme=theme)
+                               f2.mag, f2.angle, f2_cm, max_val, theme=theme,
+                               artists=_ARTISTS['f2'])
         draw_vector_with_labels(ax, 0, 0, r.x, r.y, '#28A745', 'FR',
                                r.mag, r.angle, r_cm, max_val, width=0.004,
-                               highlight=True, theme=theme)
-        
+                               highlight=True, theme=theme, artists=_ARTISTS['r'])
+
         # Construction lines
-        ax.plot([f1.x, f1.x + f2.x], [f1.y, f1.y + f2.y],
-                color='#FF6B6B', linestyle='--', linewidth=1.5, alpha=0.4)
-        ax.plot([f2.x, f2.x + f1.x], [f2.y, f2.y + f1.y],
-                color='#5B8DEE', linestyle='--', linewidth=1.5, alpha=0.4)
-        
-        # Angle arcs
-        draw_angle_arc(ax, f1.angle, '#5B8DEE', max_val, ARC_F1_RADIUS_RATIO, theme=theme)
-        draw_angle_arc(ax, f2.angle, '#FF6B6B', max_val, ARC_F2_RADIUS_RATIO, theme=theme)
-        draw_angle_arc(ax, r.angle, '#28A745', max_val, ARC_FR_RADIUS_RATIO,
-                      linewidth=2.5, highlight=True, theme=theme)
-        
-        # Styling
-        x_vals = [0, f1.x, f2.x, r.x]
-        y_vals = [0, f1.y, f2.y, r.y]
-        x_min, x_max = min(x_vals), max(x_vals)
-        y_min, y_max = min(y_vals), max(y_vals)
-        
+        _ARTISTS['construction_a'].set_data([f1.x, f1.x + f2.x], [f1.y, f1.y + f2.y])
+        _ARTISTS['construction_b'].set_data([f2.x, f2.x + f1.x], [f2.y, f2.y + f1.y])
+
+        # Angle arcs - update the shared LineCollection and label artists
+        arc_specs = ((f1.angle, ARC_F1_RADIUS_RATIO, _ARTISTS['arc_label_f1'], False),
+                     (f2.angle, ARC_F2_RADIUS_RATIO, _ARTISTS['arc_label_f2'], False),
+                     (r.angle, ARC_FR_RADIUS_RATIO, _ARTISTS['arc_label_r'], True))
+        segments = []
+        for angle, ratio, label, highlight in arc_specs:
+            if abs(angle) < ZERO_THRESHOLD:
+                # Empty segment keeps the per-arc color/linewidth alignment
+                segments.append(np.empty((0, 2)))
+                label.set_text('')
+                if highlight:
+                    _ARTISTS['arc_marker_r'].set_data([], [])
+                continue
+            arc_x, arc_y, tip_x, tip_y, rotation = arc_geometry(angle, max_val, ratio)
+            segments.append(np.column_stack((arc_x, arc_y)))
+            label.set_position((tip_x, tip_y))
+            label.set_text(f'θR = {angle:.1f}°' if highlight else f'{angle:.0f}°')
+            label.set_rotation(rotation)
+            if highlight:
+                _ARTISTS['arc_marker_r'].set_data([tip_x], [tip_y])
+        _ARTISTS['arcs'].set_segments(segments)
+
+        # Axis limits depend on the data, so set them every render
+        x_min, y_min = np.minimum(coords.min(axis=0), 0.0)
+        x_max, y_max = np.maximum(coords.max(axis=0), 0.0)
+
         padding = max_val * PADDING_RATIO
         min_neg_space = max_val * MIN_NEGATIVE_SPACE_RATIO
-        
-        ax.set_xlim(min(x_min - padding, -min_neg_space), x_max + padding)
-        ax.set_ylim(min(y_min - padding, -min_neg_space), y_max + padding)
-        ax.set_aspect('equal')
-        ax.set_facecolor(theme.background_color)
-        ax.grid(True, alpha=0.3, color=theme.grid_color, linestyle='-', linewidth=0.5)
-        ax.axhline(y=0, color=theme.grid_color, linewidth=1.5, zorder=2)
-        ax.axvline(x=0, color=theme.grid_color, linewidth=1.5, zorder=2)
-        
-        ax.set_xlabel('Fₓ (N)', fontsize=11, color=theme.text_color, fontweight='600')
-        ax.set_ylabel('Fᵧ (N)', fontsize=11, color=theme.text_color, fontweight='600')
-        ax.set_title('Vector Addition Visualization', fontsize=13, fontweight='bold',
-                    color=theme.text_color, pad=15)
-        ax.tick_params(colors=theme.text_color)
-        
-        ax.legend(loc='upper right', fontsize=10, framealpha=0.95,
-                 edgecolor=theme.text_color)
-        
-        fig.tight_layout()
-        
+
+        ax.set(xlim=(min(x_min - padding, -min_neg_space), x_max + padding),
+               ylim=(min(y_min - padding, -min_neg_space), y_max + padding))
+
+        # No legend: each arrow already carries its name/magnitude labels, and
+        # the resultant numbers are shown in the result panel. Legend layout
+        # (proxy artists + bbox measurement) was one of the pricier steps here.
+
         # Result text
         result_text = f"""**Resultant Force (FR)**
 Magnitude: {r.mag:.2f} N
@@ -99,10 +180,13 @@ Y: {r.y:.2f} N"""
         return fig, result_text, solution_text
     
     except Exception as e:
-        fig = Figure(figsize=(10, 8))
-        ax = fig.add_subplot(111)
-        ax.text(0.5, 0.5, f"Error: {str(e)}", ha='center', va='center')
-        return fig, f"Error: {str(e)}", ""
+        # Clearing the axes drops the persistent artists, so reset the
+        # handle cache and rebuild on the next successful render
+        _ARTISTS.clear()
+        _AX.clear()
+        _FIG.set_facecolor('white')
+        _AX.text(0.5, 0.5, f"Error: {str(e)}", ha='center', va='center')
+        return _FIG, f"Error: {str(e)}", ""
 
 # Create Gradio interface
 with gr.Blocks(title="Vector Addition Calculator", theme=gr.themes.Soft()) as demo:
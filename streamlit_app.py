@@ -4,20 +4,52 @@ Streamlit Web App for Vector Addition Calculator
 Mobile-friendly and deployable to Streamlit Cloud
 """
 
+import math
+import threading
+from dataclasses import dataclass
+from io import BytesIO
+
 import streamlit as st
-import matplotlib.pyplot as plt
-import matplotlib
-matplotlib.use('Agg')
-# Set default font for Matplotlib (with fallbacks)
-matplotlib.rcParams['font.family'] = ['Times New Roman', 'Times', 'Liberation Serif', 'Nimbus Roman', 'DejaVu Serif', 'serif']
-matplotlib.rcParams['font.serif'] = ['Times New Roman', 'Times', 'Liberation Serif', 'Nimbus Roman', 'DejaVu Serif']
-matplotlib.rcParams['mathtext.fontset'] = 'dejavuserif'
-from matplotlib.figure import Figure
-import matplotlib.patheffects as pe
 import numpy as np
+import pandas as pd
+
+# The heavy matplotlib pieces (Agg backend selection, Figure, the
+# font-manager scan) are loaded lazily: they cost hundreds of ms on cold
+# start and are only needed once a figure is actually drawn. matplotlib
+# core itself still loads eagerly via the vector_addition import below,
+# which needs it for its rcParams setup shared with the desktop GUIs
+Figure = None
+pe = None
+LineCollection = None
+# Shared FontProperties, built once in _load_mpl: passing a prebuilt object
+# to ax.text skips the per-call font property resolution and manager lookup
+FP_LABEL = None   # vector name labels (10pt bold)
+FP_ANGLE = None   # angle annotations (8pt bold)
+FP_FR = None      # resultant badge (12pt bold)
+FP_BADGE = None   # scale badge (11pt)
+
+def _load_mpl():
+    """Import and configure matplotlib on first use."""
+    global Figure, pe, LineCollection, FP_LABEL, FP_ANGLE, FP_FR, FP_BADGE
+    if Figure is None:
+        import matplotlib
+        matplotlib.use('Agg')
+        # Set default font for Matplotlib (with fallbacks)
+        matplotlib.rcParams['font.family'] = ['Times New Roman', 'Times', 'Liberation Serif', 'Nimbus Roman', 'DejaVu Serif', 'serif']
+        matplotlib.rcParams['font.serif'] = ['Times New Roman', 'Times', 'Liberation Serif', 'Nimbus Roman', 'DejaVu Serif']
+        matplotlib.rcParams['mathtext.fontset'] = 'dejavuserif'
+        from matplotlib.figure import Figure as _Figure
+        from matplotlib.font_manager import FontProperties
+        from matplotlib.collections import LineCollection as _LineCollection
+        import matplotlib.patheffects as _pe
+        Figure, pe, LineCollection = _Figure, _pe, _LineCollection
+        FP_LABEL = FontProperties(size=10, weight='bold')
+        FP_ANGLE = FontProperties(size=8, weight='bold')
+        FP_FR = FontProperties(size=12, weight='bold')
+        FP_BADGE = FontProperties(size=11)
 
 from vector_addition import (
-    add_vectors, ColorTheme, VectorHistory,
+    add_vectors, compute_resultant, ColorTheme, VectorData, VectorHistory,
     draw_vector_with_labels, draw_angle_arc,
     generate_solution_text, generate_direct_solution,
     PADDING_RATIO, MIN_NEGATIVE_SPACE_RATIO,
@@ -41,8 +73,9 @@ if 'num_forces' not in st.session_state:
 if 'show_result' not in st.session_state:
     st.session_state.show_result = False
 
-# Custom CSS for better mobile experience
-st.markdown("""
+# Custom CSS for better mobile experience; module constant so reruns reuse
+# the same string object (Streamlit's element dedupe then hashes a cached str)
+_CSS = """
 <style>
     /* Global font */
 html, body, [class*="css"], .stMarkdown, .stText, .stButton button, .stSelectbox, .stSlider, .stNumberInput, .stRadio {
@@ -82,16 +115,12 @@ h1, h2, h3, h4, h5, h6 {
     .manual-card hr { border: none; border-top: 1px solid #C9B99A; margin: 10px 0 14px; }
     .manual-callout { font-style: italic; color: #5B4636; }
 </style>
-""", unsafe_allow_html=True)
-
-# Header
-st.title("Vector Addition Calculator")
-st.markdown("Visualize and analyze force vectors")
+"""
+st.markdown(_CSS, unsafe_allow_html=True)
 
-# Start Guide — Classic Manual
-with st.expander("Start Guide — User Manual", expanded=True):
-    st.markdown(
-        """
+# Static start-guide HTML, built once at import instead of re-creating
+# the multi-KB literal on every rerun
+_START_GUIDE_HTML = """
 <div class="manual-card">
 <p>
   <b>Developer</b>: <a href="https://www.tiktok.com/@k00gs" target="_blank" rel="noopener noreferrer">Mar Luar Igot</a><br/>
@@ -162,9 +191,15 @@ with st.expander("Start Guide — User Manual", expanded=True):
   <li>If the plot seems cramped, adjust the <b>Scale</b> or vector magnitudes to improve spacing.</li>
 </ul>
 </div>
-""",
-        unsafe_allow_html=True,
-    )
+"""
+
+# Header
+st.title("Vector Addition Calculator")
+st.markdown("Visualize and analyze force vectors")
+
+# Start Guide — Classic Manual
+with st.expander("Start Guide — User Manual", expanded=True):
+    st.markdown(_START_GUIDE_HTML, unsafe_allow_html=True)
 
 # Helper to hide result when inputs change
 def _hide_result():
@@ -172,18 +207,344 @@ def _hide_result():
 
 # Apply inline quick input changes to main inputs
 def _apply_inline_changes():
-    try:
-        n = st.session_state.get('num_forces', 2)
-        for i in range(1, n + 1):
-            mag_key = f'inline_f{i}_mag'
-            ang_key = f'inline_f{i}_angle'
-            if mag_key in st.session_state:
-                st.session_state[f'f{i}_mag'] = st.session_state[mag_key]
-            if ang_key in st.session_state:
-                st.session_state[f'f{i}_angle'] = st.session_state[ang_key]
-        st.session_state.show_result = False
-    except Exception:
-        st.session_state.show_result = False
+    n = st.session_state.get('num_forces', 2)
+    updates = {}
+    for i in range(1, n + 1):
+        if (mag := st.session_state.get(f'inline_f{i}_mag')) is not None:
+            updates[f'f{i}_mag'] = mag
+        if (ang := st.session_state.get(f'inline_f{i}_angle')) is not None:
+            updates[f'f{i}_angle'] = ang
+    # One batched write instead of 2N individual session-state assignments
+    st.session_state.update(updates)
+    # Drop the grid's edit state so it re-seeds from the updated values
+    st.session_state.pop('force_grid', None)
+    st.session_state.show_result = False
+
+# Render-time constants hoisted out of the per-render path
+COLORS = ('#5B8DEE', '#FF6B6B', '#9B59B6', '#F39C12', '#1ABC9C', '#E74C3C', '#3498DB', '#2ECC71', '#E67E22', '#95A5A6')
+# Palette unrolled to the same length as SUBSCRIPTS so per-vector sites can
+# index it directly instead of taking a modulus every iteration
+COLOR_CYCLE = tuple(COLORS[i % len(COLORS)] for i in range(99))
+# Covers any force count the UI can produce, so loops index it directly
+# instead of branching on i < 10 every iteration
+SUBSCRIPTS = (tuple(chr(0x2080 + i) for i in range(1, 11))
+              + tuple(str(i) for i in range(11, 100)))
+
+@dataclass
+class VectorBatch:
+    """Parallel per-vector component arrays (SoA layout for the renderer)."""
+    vx: np.ndarray
+    vy: np.ndarray
+    mag: np.ndarray
+    angle: np.ndarray
+
+def _svg_preview(vxs, vys, method, var_symbol):
+    """Build the live-preview drawing as an inline SVG string.
+
+    The preview reruns on every input edit, so it must not pay matplotlib's
+    figure cost; formatting a few SVG elements is sub-millisecond.
+    """
+    if method == "Parallelogram":
+        vxs, vys = vxs[:2], vys[:2]
+        x0 = np.zeros_like(vxs)
+        y0 = np.zeros_like(vys)
+    else:
+        x0 = np.concatenate(([0.0], vxs.cumsum()))[:-1]
+        y0 = np.concatenate(([0.0], vys.cumsum()))[:-1]
+    x1 = x0 + vxs
+    y1 = y0 + vys
+
+    span = max(np.abs(x1).max(initial=0.0), np.abs(y1).max(initial=0.0), 1e-6) * 1.2
+    size = 2.0 * span
+    sw = span / 150  # hairline stroke in user units
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" '
+        f'viewBox="{-span:.4g} {-span:.4g} {size:.4g} {size:.4g}" '
+        f'width="100%" style="max-height:480px;background:#F8FAFB">',
+        f'<line x1="{-span:.4g}" y1="0" x2="{span:.4g}" y2="0" stroke="#B0BEC5" stroke-width="{sw:.4g}"/>',
+        f'<line x1="0" y1="{-span:.4g}" x2="0" y2="{span:.4g}" stroke="#B0BEC5" stroke-width="{sw:.4g}"/>',
+    ]
+    head = span * 0.04
+    for i in range(len(x1)):
+        color = COLOR_CYCLE[i]
+        # SVG y grows downward, so flip the y coordinates
+        ax0, ay0, ax1, ay1 = x0[i], -y0[i], x1[i], -y1[i]
+        parts.append(f'<line x1="{ax0:.4g}" y1="{ay0:.4g}" x2="{ax1:.4g}" y2="{ay1:.4g}" '
+                     f'stroke="{color}" stroke-width="{sw * 3:.4g}"/>')
+        dx, dy = ax1 - ax0, ay1 - ay0
+        norm = math.hypot(dx, dy)
+        if norm > 0:
+            # Triangular arrowhead at the tip
+            ux, uy = dx / norm, dy / norm
+            bx, by = ax1 - ux * head, ay1 - uy * head
+            px, py = -uy * head * 0.5, ux * head * 0.5
+            parts.append(f'<polygon fill="{color}" points="{ax1:.4g},{ay1:.4g} '
+                         f'{bx + px:.4g},{by + py:.4g} {bx - px:.4g},{by - py:.4g}"/>')
+        sub = SUBSCRIPTS[i]
+        mx, my = (ax0 + ax1) / 2, (ay0 + ay1) / 2
+        parts.append(f'<text x="{mx:.4g}" y="{my:.4g}" fill="{color}" '
+                     f'font-size="{span * 0.06:.4g}" font-weight="bold">{var_symbol}{sub}</text>')
+    parts.append('</svg>')
+    return ''.join(parts)
+
+# Substitution pairs for re-symbolizing solution text, longest first so
+# e.g. 'F₁ₓ' is rewritten before 'F₁' can match inside it
+_SYMBOL_PAIRS = ('F₁ₓ', 'F₁ᵧ', 'F₂ₓ', 'F₂ᵧ', 'FRₓ', 'FRᵧ', 'F₁', 'F₂', 'FR')
+
+def _resymbolize(text, var_symbol):
+    """Swap the F-based labels in solution text for the quantity's symbol."""
+    if var_symbol == 'F':
+        return text
+    for label in _SYMBOL_PAIRS:
+        text = text.replace(label, var_symbol + label[1:])
+    return text
+
+@st.cache_data(max_entries=32)
+def _direct_solution(f1_key, f2_key, r_key, scale, unit_label, var_symbol):
+    """Build (and cache) the direct solution transcript for one result."""
+    text = generate_direct_solution(VectorData(*f1_key), VectorData(*f2_key),
+                                    VectorData(*r_key), scale, unit=unit_label)
+    return _resymbolize(text, var_symbol)
+
+@st.cache_data(max_entries=32)
+def _detailed_solution(f1_key, f2_key, r_key, scale, unit_label, var_symbol):
+    """Build (and cache) the step-by-step solution for one result."""
+    text = generate_solution_text(VectorData(*f1_key), VectorData(*f2_key),
+                                  VectorData(*r_key), scale, unit=unit_label)
+    return _resymbolize(text, var_symbol)
+
+# One shared Figure/Agg canvas for every render: figure and canvas
+# construction is a large fixed matplotlib cost, and cache misses only need
+# a cleared Axes. Sessions run in separate threads, so renders serialize.
+_RENDER_LOCK = threading.Lock()
+_RENDER_FIG = None
+
+@st.cache_data(max_entries=32)
+def _render_figure(vectors, r, scale, method, unit_label, var_symbol,
+                   show_fr=True, dpi=72):
+    """Render the vector plot and return it as PNG bytes.
+
+    Cached on the argument tuple, so widget-triggered reruns with unchanged
+    inputs skip matplotlib entirely. ``vectors`` is a tuple of
+    (x, y, mag, angle) tuples; ``r`` is the resultant as the same 4-tuple,
+    or None for a preview without the resultant.
+
+    The 72 dpi default keeps on-screen rasters (and their PNG encode and
+    transfer cost) small; the browser rescales anyway. Exports pass a
+    higher dpi explicitly.
+    """
+    with _RENDER_LOCK:
+        return _draw_figure(vectors, r, scale, method, unit_label, var_symbol,
+                            show_fr, dpi)
+
+def _draw_figure(vectors, r, scale, method, unit_label, var_symbol, show_fr, dpi):
+    """Draw into the shared figure; caller must hold _RENDER_LOCK."""
+    global _RENDER_FIG
+    _load_mpl()
+    if _RENDER_FIG is None:
+        # constrained layout solves once at draw time; tight_layout ran a
+        # multi-pass bbox inspection on every render
+        _RENDER_FIG = Figure(figsize=(12, 7), dpi=100, layout='constrained')
+
+    theme = ColorTheme.ocean_theme()
+    arr = np.asarray(vectors, dtype=np.float64).reshape(-1, 4)
+    vb = VectorBatch(arr[:, 0], arr[:, 1], arr[:, 2], arr[:, 3])
+    vector_list = [VectorData(*v) for v in vectors]
+    r = VectorData(*r) if r is not None else None
+
+    fig = _RENDER_FIG
+    fig.set_facecolor(theme.background_color)
+    if fig.axes:
+        ax = fig.axes[0]
+        ax.clear()
+    else:
+        ax = fig.add_subplot(111)
+    ax.set_facecolor(theme.background_color)
+
+    # Calculate max value for scaling with vectorized reductions over the
+    # component columns instead of a per-vector Python loop
+    max_val = max(np.abs(vb.vx).max(initial=0.0), np.abs(vb.vy).max(initial=0.0), 1e-6)
+    if r is not None:
+        max_val = max(max_val, abs(r.x), abs(r.y))
+
+    # Cumulative tip-to-tail positions, shared by the polygon draw and the
+    # axis limits
+    cx = np.concatenate(([0.0], vb.vx.cumsum()))
+    cy = np.concatenate(([0.0], vb.vy.cumsum()))
+
+
+    if method == "Parallelogram":
+        # Parallelogram method: only works for 2 vectors
+        if len(vector_list) >= 2 and show_fr and r is not None:
+            f1, f2 = vector_list[0], vector_list[1]
+            f1_cm = f1.mag / scale
+            f2_cm = f2.mag / scale
+            r_cm = r.mag / scale
+
+            draw_vector_with_labels(ax, 0, 0, f1.x, f1.y, COLORS[0], f'{var_symbol}₁',
+                                   f1.mag, f1.angle, f1_cm, max_val, theme=theme, unit=unit_label)
+            draw_vector_with_labels(ax, 0, 0, f2.x, f2.y, COLORS[1], f'{var_symbol}₂',
+                                   f2.mag, f2.angle, f2_cm, max_val, theme=theme, unit=unit_label)
+            draw_vector_with_labels(ax, 0, 0, r.x, r.y, '#28A745', f'{var_symbol}R',
+                                   r.mag, r.angle, r_cm, max_val, width=0.004,
+                                   highlight=True, theme=theme, unit=unit_label)
+
+            # Construction lines for parallelogram: one two-segment
+            # LineCollection instead of a Line2D artist per line
+            segs = [[(f1.x, f1.y), (f1.x + f2.x, f1.y + f2.y)],
+                    [(f2.x, f2.y), (f2.x + f1.x, f2.y + f1.y)]]
+            ax.add_collection(LineCollection(segs, colors=(COLORS[1], COLORS[0]),
+                                             linestyles='--', linewidths=1.5, alpha=0.4))
+
+            # Angle arcs for parallelogram
+            draw_angle_arc(ax, f1.angle, COLORS[0], max_val, ARC_F1_RADIUS_RATIO, theme=theme)
+            draw_angle_arc(ax, f2.angle, COLORS[1], max_val, ARC_F2_RADIUS_RATIO, theme=theme)
+        else:
+            # Preview: individual vectors from the origin, no resultant
+            for i, v in enumerate(vector_list[:2]):
+                v_cm = v.mag / scale if scale else 0
+                sub = SUBSCRIPTS[i]
+                draw_vector_with_labels(ax, 0, 0, v.x, v.y, COLOR_CYCLE[i], f'{var_symbol}{sub}',
+                                       v.mag, v.angle, v_cm, max_val, theme=theme, unit=unit_label)
+                draw_angle_arc(ax, v.angle, COLOR_CYCLE[i], max_val,
+                              ARC_F1_RADIUS_RATIO if i == 0 else ARC_F2_RADIUS_RATIO, theme=theme)
+
+    else:  # Polygon (Tip-to-Tail) method
+        color_seq = list(COLOR_CYCLE[:len(vector_list)])
+
+        # All arc polylines from one broadcast over a shared unit grid:
+        # N*50 trig values in two ufunc calls instead of a linspace+cos+sin
+        # triple per vector
+        rads = np.deg2rad(vb.angle)
+        theta_mat = np.linspace(0.0, 1.0, 50)[None, :] * rads[:, None]
+        cos_mat = np.cos(theta_mat)
+        sin_mat = np.sin(theta_mat)
+        arc_radii = max_val * 0.1 * (0.8 + np.arange(len(vector_list)) * 0.2)
+        # Left-pointing vectors get their labels flipped upright; one masked
+        # comparison over the angle array instead of a branch per vector
+        label_rots = np.where((vb.angle > 90.0) & (vb.angle < 270.0), 180, 0)
+
+        # All arrows in one batched quiver and all tip dots in one scatter:
+        # a single artist each instead of one per vector
+        ax.quiver(cx[:-1], cy[:-1], vb.vx, vb.vy, angles='xy', scale_units='xy', scale=1,
+                  color=color_seq, width=0.003, zorder=3)
+        ax.scatter(cx[1:], cy[1:], c=color_seq, s=25, zorder=4)
+
+        for i, v in enumerate(vector_list):
+            if v.mag == 0:
+                # Zero-length vectors have no visible shaft; skip their labels
+                continue
+            subscript = SUBSCRIPTS[i]
+            color = color_seq[i]
+
+            # Add force label near the middle of the vector
+            mid_x = (cx[i] + cx[i + 1]) * 0.5
+            mid_y = (cy[i] + cy[i + 1]) * 0.5
+            ax.text(mid_x, mid_y, f'{var_symbol}{subscript}',
+                    fontproperties=FP_LABEL, color=color,
+                    ha='center', va='center', zorder=10, rotation=int(label_rots[i]))
+
+            # Add angle arc from starting point of each vector
+            if abs(v.angle) > 0.1:  # Only draw if angle is significant
+                arc_x = cx[i] + arc_radii[i] * cos_mat[i]
+                arc_y = cy[i] + arc_radii[i] * sin_mat[i]
+                ax.plot(arc_x, arc_y, color=color, linewidth=1.5, zorder=2, alpha=0.7)
+
+                # Add angle label (always upright, positioned smartly)
+                label_angle_rad = rads[i] * 0.5
+                label_radius = arc_radii[i] * 1.3
+                label_x = cx[i] + label_radius * np.cos(label_angle_rad)
+                label_y = cy[i] + label_radius * np.sin(label_angle_rad)
+                ax.text(label_x, label_y, f'{v.angle:.0f}°',
+                        fontproperties=FP_ANGLE, color=color,
+                        ha='center', va='center', zorder=10, rotation=0)
+
+        if show_fr and r is not None:
+            # Draw resultant with highlight
+            r_cm = r.mag / scale
+            ax.quiver(0, 0, r.x, r.y, angles='xy', scale_units='xy', scale=1,
+                      color='#28A745', width=0.004,
+                      label=f'{var_symbol}R = {r.mag:.2f}{unit_label}, θ = {r.angle:.2f}°', zorder=5)
+
+            # Add FR label near the vector (no background)
+            r_label_x = r.x * 0.35
+            r_label_y = r.y * 0.35
+            fr_bbox = dict(boxstyle='round,pad=0.25', facecolor='none',
+                            edgecolor='#28A745', linewidth=1.5)
+            fr_text = ax.text(r_label_x, r_label_y, f'{var_symbol}R',
+                    fontproperties=FP_FR, color='black',
+                    ha='center', va='center', zorder=12, bbox=fr_bbox)
+            fr_text.set_path_effects([pe.withStroke(linewidth=2, foreground='white')])
+
+            # Add magnitude label for resultant (no background)
+            r_mid_x = r.x * 0.65
+            r_mid_y = r.y * 0.65
+            ax.text(r_mid_x, r_mid_y, f'{r_cm:.2f} cm',
+                    fontproperties=FP_LABEL, color='#28A745',
+                    ha='center', va='center', zorder=10)
+
+    # Always show resultant angle
+    if show_fr and r is not None:
+        draw_angle_arc(ax, r.angle, '#28A745', max_val, ARC_FR_RADIUS_RATIO,
+                      linewidth=2.5, highlight=True, theme=theme)
+
+    # Styling: bounds from vectorized reductions over the cumulative
+    # positions and the origin-anchored component endpoints
+    r_x = 0.0 if r is None else r.x
+    r_y = 0.0 if r is None else r.y
+    x_min = min(cx.min(), vb.vx.min(initial=0.0), r_x)
+    x_max = max(cx.max(), vb.vx.max(initial=0.0), r_x)
+    y_min = min(cy.min(), vb.vy.min(initial=0.0), r_y)
+    y_max = max(cy.max(), vb.vy.max(initial=0.0), r_y)
+
+    padding = max_val * PADDING_RATIO
+    min_neg_space = max_val * MIN_NEGATIVE_SPACE_RATIO
+
+    ax.set_xlim(min(x_min - padding, -min_neg_space), x_max + padding)
+    ax.set_ylim(min(y_min - padding, -min_neg_space), y_max + padding)
+    ax.set_aspect('equal')
+    ax.set_facecolor(theme.background_color)
+    ax.grid(True, alpha=0.3, color=theme.grid_color, linestyle='-', linewidth=0.5)
+    ax.axhline(y=0, color=theme.grid_color, linewidth=1.5, zorder=2)
+    ax.axvline(x=0, color=theme.grid_color, linewidth=1.5, zorder=2)
+
+    ax.set_xlabel(f'{var_symbol}ₓ ({unit_label})', fontsize=11, color=theme.text_color, fontweight='600')
+    ax.set_ylabel(f'{var_symbol}ᵧ ({unit_label})', fontsize=11, color=theme.text_color, fontweight='600')
+
+    # Create title with legend info inline
+    if not show_fr or r is None:
+        ax.set_title('Vector Preview', fontsize=13, fontweight='bold',
+                    color=theme.text_color, pad=15)
+    elif method == "Polygon (Tip-to-Tail)":
+        # Build horizontal legend text
+        legend_parts = []
+        for i, v in enumerate(vector_list):
+            subscript = SUBSCRIPTS[i]
+            legend_parts.append(f'{var_symbol}{subscript}={v.mag:.1f}{unit_label}@{v.angle:.0f}°')
+        legend_parts.append(f'{var_symbol}R={r.mag:.1f}{unit_label}@{r.angle:.1f}°')
+        title = f'Vector Addition - {method}\n' + ' | '.join(legend_parts)
+        ax.set_title(title, fontsize=11, fontweight='bold',
+                    color=theme.text_color, pad=10)
+    else:
+        title = f'Vector Addition - {method} Method'
+        ax.set_title(title, fontsize=13, fontweight='bold',
+                    color=theme.text_color, pad=15)
+        # Keep legend for parallelogram
+        legend = ax.legend(loc='upper right', fontsize=8, framealpha=0.95,
+                          edgecolor=theme.text_color,
+                          borderpad=0.4, labelspacing=0.3, handlelength=1.5, handletextpad=0.5)
+
+    ax.tick_params(colors=theme.text_color)
+
+    # Show scale in top-left corner
+    ax.text(0.02, 0.98, f'Scale: 1 cm = {scale} {unit_label}', transform=ax.transAxes,
+            fontproperties=FP_BADGE, color=theme.text_color,
+            ha='left', va='top', zorder=10,
+            bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.8, edgecolor=theme.grid_color))
+
+    buf = BytesIO()
+    fig.savefig(buf, format='png', dpi=dpi)
+    return buf.getvalue()
 
 # Sidebar for inputs
 with st.sidebar:
@@ -224,14 +585,9 @@ with st.sidebar:
     )
     
     st.divider()
-    
-    # Scale settings
-    st.subheader("Scale")
-    scale = st.number_input(f"1 cm equals ({unit_label}):", min_value=0.1, value=10.0, step=0.5, on_change=_hide_result)
-    
-    st.divider()
-    
-    # Number of forces (only for polygon method)
+
+    # Number of forces (only for polygon method); stays outside the form
+    # because it changes how many input rows render
     if method == "Polygon (Tip-to-Tail)":
         st.subheader("Number of Forces")
         num_forces = st.number_input("How many forces?", min_value=2, max_value=10, value=st.session_state.num_forces, step=1, key="num_forces_input", on_change=_hide_result)
@@ -239,47 +595,48 @@ with st.sidebar:
         st.divider()
     else:
         num_forces = 2
-    
-    # Dynamic inputs
+
+    # Scale and per-force inputs live in one form: edits inside it no longer
+    # rerun the whole script per keystroke, only the Calculate submit does
     forces = []
-    for i in range(num_forces):
-        sub = chr(0x2080 + (i + 1)) if (i + 1) < 10 else str(i + 1)
-        st.subheader(f"{quantity} {i+1} ({var_symbol}{sub})")
-        mag = st.number_input(f"Magnitude ({unit_label}):", min_value=0.0, value=0.0, step=1.0, key=f"f{i+1}_mag", on_change=_hide_result)
-        angle = st.number_input(f"Angle (°):", min_value=0.0, max_value=360.0, value=0.0, step=1.0, key=f"f{i+1}_angle", on_change=_hide_result)
-        forces.append((mag, angle))
+    with st.form("inputs", clear_on_submit=False):
+        st.subheader("Scale")
+        scale = st.number_input(f"1 cm equals ({unit_label}):", min_value=0.1, value=10.0, step=0.5)
         st.divider()
-    
-    # Remove last divider
-    st.markdown("")
-    
-    # Controls
-    col1, col2 = st.columns(2)
-    with col1:
-        calculate_btn = st.button("Calculate", use_container_width=True, type="primary")
-    with col2:
-        show_solution = st.checkbox("Show Steps", value=False)
+        st.subheader(f"{quantity} Vectors")
+        # One editable grid instead of 2N stacked number inputs: a single
+        # widget and DOM node regardless of the force count
+        force_df = pd.DataFrame({
+            "Magnitude": [float(st.session_state.get(f"f{i+1}_mag", 0.0)) for i in range(num_forces)],
+            "Angle": [float(st.session_state.get(f"f{i+1}_angle", 0.0)) for i in range(num_forces)],
+        }, index=[f"{var_symbol}{i+1}" for i in range(num_forces)])
+        edited = st.data_editor(
+            force_df, num_rows="fixed", use_container_width=True, key="force_grid",
+            column_config={
+                "Magnitude": st.column_config.NumberColumn(f"Magnitude ({unit_label})", min_value=0.0, step=1.0, required=True),
+                "Angle": st.column_config.NumberColumn("Angle (°)", min_value=0.0, max_value=360.0, step=1.0, required=True),
+            })
+        # required=True stops the editor committing blank cells, but guard
+        # against NaN anyway so a cleared cell can never reach the math
+        edited = edited.fillna(0.0)
+        forces = [(float(m), float(a)) for m, a in zip(edited["Magnitude"], edited["Angle"])]
+        # Mirror into session state so Quick Inputs keep working
+        for i, (m, a) in enumerate(forces):
+            st.session_state[f"f{i+1}_mag"] = m
+            st.session_state[f"f{i+1}_angle"] = a
+        calculate_btn = st.form_submit_button("Calculate", use_container_width=True, type="primary")
+
+    show_solution = st.checkbox("Show Steps", value=False)
 
 # Main content area
 if calculate_btn:
     try:
-        # Calculate vectors and resultant only on Calculate
-        from vector_addition import VectorData
-        
-        vector_list = []
-        resultant_x, resultant_y = 0.0, 0.0
-        
-        for i, (mag, angle) in enumerate(forces):
-            angle_rad = np.radians(angle)
-            vx = mag * np.cos(angle_rad)
-            vy = mag * np.sin(angle_rad)
-            vector_list.append(VectorData(vx, vy, mag, angle))
-            resultant_x += vx
-            resultant_y += vy
-        
-        # Calculate resultant magnitude and angle
-        r_mag = np.sqrt(resultant_x**2 + resultant_y**2)
-        r_angle = np.degrees(np.arctan2(resultant_y, resultant_x))
+        # Calculate vectors and resultant only on Calculate; the numeric
+        # kernel lives in vector_addition so numba can JIT it when present
+        mags, angs = np.asarray(forces, dtype=np.float64).T
+        vxs, vys, resultant_x, resultant_y, r_mag, r_angle = compute_resultant(mags, angs)
+        vector_list = [VectorData(vxs[i], vys[i], mags[i], angs[i])
+                       for i in range(len(forces))]
         r = VectorData(resultant_x, resultant_y, r_mag, r_angle)
         
         # For history (only store first two forces for compatibility)
@@ -293,184 +650,16 @@ if calculate_btn:
         st.subheader("Vector Visualization")
         st.info(f"🔹 **Method:** {method}")
         
-        # Create plot
-        fig = Figure(figsize=(12, 7), dpi=100, facecolor=st.session_state.theme.background_color)
-        ax = fig.add_subplot(111, facecolor=st.session_state.theme.background_color)
-        
-        # Calculate max value for scaling
-        all_vals = [0]
-        for v in vector_list:
-            all_vals.extend([abs(v.x), abs(v.y)])
-        all_vals.extend([abs(r.x), abs(r.y)])
-        max_val = max(all_vals)
-        
-        # Color palette for multiple vectors
-        colors = ['#5B8DEE', '#FF6B6B', '#9B59B6', '#F39C12', '#1ABC9C', '#E74C3C', '#3498DB', '#2ECC71', '#E67E22', '#95A5A6']
-        
-        if method == "Parallelogram":
-            # Parallelogram method: only works for 2 vectors
-            if len(vector_list) == 2:
-                f1, f2 = vector_list[0], vector_list[1]
-                f1_cm = f1.mag / scale
-                f2_cm = f2.mag / scale
-                r_cm = r.mag / scale
-                
-                draw_vector_with_labels(ax, 0, 0, f1.x, f1.y, colors[0], f'{var_symbol}₁',
-                                       f1.mag, f1.angle, f1_cm, max_val, theme=st.session_state.theme, unit=unit_label)
-                draw_vector_with_labels(ax, 0, 0, f2.x, f2.y, colors[1], f'{var_symbol}₂',
-                                       f2.mag, f2.angle, f2_cm, max_val, theme=st.session_state.theme, unit=unit_label)
-                draw_vector_with_labels(ax, 0, 0, r.x, r.y, '#28A745', f'{var_symbol}R',
-                                       r.mag, r.angle, r_cm, max_val, width=0.004,
-                                       highlight=True, theme=st.session_state.theme, unit=unit_label)
-                
-                # Construction lines for parallelogram
-                ax.plot([f1.x, f1.x + f2.x], [f1.y, f1.y + f2.y],
-                        color=colors[1], linestyle='--', linewidth=1.5, alpha=0.4)
-                ax.plot([f2.x, f2.x + f1.x], [f2.y, f2.y + f1.y],
-                        color=colors[0], linestyle='--', linewidth=1.5, alpha=0.4)
-                
-                # Angle arcs for parallelogram
-                draw_angle_arc(ax, f1.angle, colors[0], max_val, ARC_F1_RADIUS_RATIO, theme=st.session_state.theme)
-                draw_angle_arc(ax, f2.angle, colors[1], max_val, ARC_F2_RADIUS_RATIO, theme=st.session_state.theme)
-        
-        else:  # Polygon (Tip-to-Tail) method
-            # Draw vectors tip-to-tail with labels and angle arcs
-            cumulative_x, cumulative_y = 0.0, 0.0
-            
-            for i, v in enumerate(vector_list):
-                v_cm = v.mag / scale
-                subscript = chr(0x2080 + i + 1) if i < 10 else str(i + 1)
-                color = colors[i % len(colors)]
-                
-                # Draw arrow (no label in quiver since we have title legend)
-                ax.quiver(cumulative_x, cumulative_y, v.x, v.y, angles='xy', scale_units='xy', scale=1,
-                          color=color, width=0.003, zorder=3)
-                
-                # Add force label near the middle of the vector
-                mid_x = cumulative_x + v.x * 0.5
-                mid_y = cumulative_y + v.y * 0.5
-                # Rotate 180° for left-pointing vectors to keep readable
-                label_rotation = 180 if (v.angle > 90 and v.angle < 270) else 0
-                ax.text(mid_x, mid_y, f'{var_symbol}{subscript}', 
-                        fontsize=10, color=color, fontweight='bold',
-                        ha='center', va='center', zorder=10, rotation=label_rotation)
-                
-                # Add angle arc from starting point of each vector
-                if abs(v.angle) > 0.1:  # Only draw if angle is significant
-                    arc_radius = max_val * 0.1 * (0.8 + i * 0.2)  # Increasing radius for each vector
-                    theta = np.linspace(0, np.radians(v.angle), 50)
-                    arc_x = cumulative_x + arc_radius * np.cos(theta)
-                    arc_y = cumulative_y + arc_radius * np.sin(theta)
-                    ax.plot(arc_x, arc_y, color=color, linewidth=1.5, zorder=2, alpha=0.7)
-                    
-                    # Add angle label (always upright, positioned smartly)
-                    label_angle_rad = np.radians(v.angle * 0.5)
-                    label_radius = arc_radius * 1.3
-                    label_x = cumulative_x + label_radius * np.cos(label_angle_rad)
-                    label_y = cumulative_y + label_radius * np.sin(label_angle_rad)
-                    ax.text(label_x, label_y, f'{v.angle:.0f}°', 
-                            fontsize=8, color=color, fontweight='bold',
-                            ha='center', va='center', zorder=10, rotation=0)
-                
-                # Add dot at tip
-                tip_x = cumulative_x + v.x
-                tip_y = cumulative_y + v.y
-                ax.plot(tip_x, tip_y, 'o', color=color, markersize=5, zorder=4)
-                
-                cumulative_x += v.x
-                cumulative_y += v.y
-            
-            # Draw resultant with highlight
-            r_cm = r.mag / scale
-            ax.quiver(0, 0, r.x, r.y, angles='xy', scale_units='xy', scale=1,
-                      color='#28A745', width=0.004, 
-                      label=f'{var_symbol}R = {r.mag:.2f}{unit_label}, θ = {r.angle:.2f}°', zorder=5)
-            
-            # Add FR label near the vector (no background)
-            r_label_x = r.x * 0.35
-            r_label_y = r.y * 0.35
-            fr_bbox = dict(boxstyle='round,pad=0.25', facecolor='none',
-                            edgecolor='#28A745', linewidth=1.5)
-            fr_text = ax.text(r_label_x, r_label_y, f'{var_symbol}R', 
-                    fontsize=12, color='black', fontweight='bold',
-                    ha='center', va='center', zorder=12, bbox=fr_bbox)
-            fr_text.set_path_effects([pe.withStroke(linewidth=2, foreground='white')])
-            
-            # Add magnitude label for resultant (no background)
-            r_mid_x = r.x * 0.65
-            r_mid_y = r.y * 0.65
-            ax.text(r_mid_x, r_mid_y, f'{r_cm:.2f} cm', 
-                    fontsize=10, color='#28A745', fontweight='bold',
-                    ha='center', va='center', zorder=10)
-        
-        # Always show resultant angle
-        draw_angle_arc(ax, r.angle, '#28A745', max_val, ARC_FR_RADIUS_RATIO,
-                      linewidth=2.5, highlight=True, theme=st.session_state.theme)
-        
-        # Styling
-        x_vals = [0, r.x]
-        y_vals = [0, r.y]
-        cumulative_x, cumulative_y = 0.0, 0.0
-        for v in vector_list:
-            x_vals.extend([v.x, cumulative_x])
-            y_vals.extend([v.y, cumulative_y])
-            cumulative_x += v.x
-            cumulative_y += v.y
-        x_min, x_max = min(x_vals), max(x_vals)
-        y_min, y_max = min(y_vals), max(y_vals)
-        
-        padding = max_val * PADDING_RATIO
-        min_neg_space = max_val * MIN_NEGATIVE_SPACE_RATIO
-        
-        ax.set_xlim(min(x_min - padding, -min_neg_space), x_max + padding)
-        ax.set_ylim(min(y_min - padding, -min_neg_space), y_max + padding)
-        ax.set_aspect('equal')
-        ax.set_facecolor(st.session_state.theme.background_color)
-        ax.grid(True, alpha=0.3, color=st.session_state.theme.grid_color, linestyle='-', linewidth=0.5)
-        ax.axhline(y=0, color=st.session_state.theme.grid_color, linewidth=1.5, zorder=2)
-        ax.axvline(x=0, color=st.session_state.theme.grid_color, linewidth=1.5, zorder=2)
-        
-        # Map quantity type to variable symbol
-        var_symbols = {
-            "Force": "F",
-            "Displacement": "d",
-            "Velocity": "V",
-            "Acceleration": "a"
-        }
-        var_symbol = var_symbols.get(quantity, "F")
-        ax.set_xlabel(f'{var_symbol}ₓ ({unit_label})', fontsize=11, color=st.session_state.theme.text_color, fontweight='600')
-        ax.set_ylabel(f'{var_symbol}ᵧ ({unit_label})', fontsize=11, color=st.session_state.theme.text_color, fontweight='600')
-        
-        # Create title with legend info inline
-        if method == "Polygon (Tip-to-Tail)":
-            # Build horizontal legend text
-            legend_parts = []
-            for i, v in enumerate(vector_list):
-                subscript = chr(0x2080 + i + 1) if i < 10 else str(i + 1)
-                legend_parts.append(f'{var_symbol}{subscript}={v.mag:.1f}{unit_label}@{v.angle:.0f}°')
-            legend_parts.append(f'{var_symbol}R={r.mag:.1f}{unit_label}@{r.angle:.1f}°')
-            title = f'Vector Addition - {method}\n' + ' | '.join(legend_parts)
-            ax.set_title(title, fontsize=11, fontweight='bold',
-                        color=st.session_state.theme.text_color, pad=10)
+        # Render (cached): unchanged inputs reuse the PNG from the last run.
+        # All-zero magnitudes (the default form state) draw nothing useful,
+        # so that case skips the matplotlib path entirely
+        vectors_key = tuple((v.x, v.y, v.mag, v.angle) for v in vector_list)
+        r_key = (r.x, r.y, r.mag, r.angle)
+        if mags.any():
+            png = _render_figure(vectors_key, r_key, scale, method, unit_label, var_symbol)
+            st.image(png, width='stretch')
         else:
-            title = f'Vector Addition - {method} Method'
-            ax.set_title(title, fontsize=13, fontweight='bold',
-                        color=st.session_state.theme.text_color, pad=15)
-            # Keep legend for parallelogram
-            legend = ax.legend(loc='upper right', fontsize=8, framealpha=0.95,
-                              edgecolor=st.session_state.theme.text_color,
-                              borderpad=0.4, labelspacing=0.3, handlelength=1.5, handletextpad=0.5)
-        
-        ax.tick_params(colors=st.session_state.theme.text_color)
-        
-        # Show scale in top-left corner
-        ax.text(0.02, 0.98, f'Scale: 1 cm = {scale} {unit_label}', transform=ax.transAxes,
-                fontsize=11, color=st.session_state.theme.text_color,
-                ha='left', va='top', zorder=10,
-                bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.8, edgecolor=st.session_state.theme.grid_color))
-        
-        fig.tight_layout()
-        st.pyplot(fig, width='stretch')
+            st.info("Enter non-zero magnitudes to see the plot")
         
         # Quick Inputs below plot
         st.divider()
@@ -489,14 +678,17 @@ if calculate_btn:
         st.button("Apply Inline Changes", type="primary", use_container_width=True, on_click=_apply_inline_changes)
         
         # Export button
-        if st.button("Download Plot (PNG)", use_container_width=True):
-            from io import BytesIO
-            buf = BytesIO()
-            fig.savefig(buf, format='png', dpi=300, bbox_inches='tight')
-            buf.seek(0)
+        # Default export rasterizes at dpi=150; 300 is 4x the pixel work and
+        # only worth it when explicitly requested
+        if mags.any():
+            hi_res = st.checkbox("High-resolution export (300 dpi)", value=False)
+            # Feed the cached renderer straight into the download button: the
+            # bytes come from the same keyed cache, and dropping the extra
+            # reveal button removes the double-click (and the extra rerun)
             st.download_button(
-                label="Click to Download",
-                data=buf,
+                label="Download Plot (PNG)",
+                data=_render_figure(vectors_key, r_key, scale, method, unit_label,
+                                    var_symbol, dpi=300 if hi_res else 150),
                 file_name="vector_plot.png",
                 mime="image/png",
                 use_container_width=True
@@ -524,15 +716,10 @@ if calculate_btn:
         with col_right:
             st.subheader("Direct Solution")
             if len(vector_list) >= 2:
-                solution_text = generate_direct_solution(vector_list[0], vector_list[1], r, scale, unit=unit_label)
-                # Replace F with chosen symbol in solution text
-                for a, b in [
-                    ('F₁ₓ', f'{var_symbol}₁ₓ'), ('F₁ᵧ', f'{var_symbol}₁ᵧ'), ('F₂ₓ', f'{var_symbol}₂ₓ'), ('F₂ᵧ', f'{var_symbol}₂ᵧ'),
-                    ('FRₓ', f'{var_symbol}Rₓ'), ('FRᵧ', f'{var_symbol}Rᵧ'),
-                    ('F₁', f'{var_symbol}₁'), ('F₂', f'{var_symbol}₂'), ('FR', f'{var_symbol}R')
-                ]:
-                    solution_text = solution_text.replace(a, b)
-                st.code(solution_text, language=None)
+                # Cached per result, so reruns from unrelated widgets reuse
+                # the generated (and re-symbolized) transcript
+                st.code(_direct_solution(vectors_key[0], vectors_key[1], r_key,
+                                         scale, unit_label, var_symbol), language=None)
             else:
                 st.write("Solution text available for 2+ forces")
         
@@ -541,27 +728,27 @@ if calculate_btn:
             st.divider()
             st.subheader("Detailed Analytical Solution")
             if len(vector_list) >= 2:
-                detailed_solution_text = generate_solution_text(vector_list[0], vector_list[1], r, scale, unit=unit_label)
-                for a, b in [
-                    ('F₁ₓ', f'{var_symbol}₁ₓ'), ('F₁ᵧ', f'{var_symbol}₁ᵧ'), ('F₂ₓ', f'{var_symbol}₂ₓ'), ('F₂ᵧ', f'{var_symbol}₂ᵧ'),
-                    ('FRₓ', f'{var_symbol}Rₓ'), ('FRᵧ', f'{var_symbol}Rᵧ'),
-                    ('F₁', f'{var_symbol}₁'), ('F₂', f'{var_symbol}₂'), ('FR', f'{var_symbol}R')
-                ]:
-                    detailed_solution_text = detailed_solution_text.replace(a, b)
-                st.code(detailed_solution_text, language=None)
+                st.code(_detailed_solution(vectors_key[0], vectors_key[1], r_key,
+                                           scale, unit_label, var_symbol), language=None)
             else:
                 st.write("Detailed solution available for 2+ forces")
         
         # History
         if len(st.session_state.history) > 1:
             with st.expander("Calculation History"):
-                history = st.session_state.history.get_all()
-                for i, entry in enumerate(reversed(history[-10:])):  # Show last 10
-                    st.text(
-                        f"{len(history)-i}. {var_symbol}₁={entry['f1_mag']}{unit_label}@{entry['f1_angle']}° | "
-                        f"{var_symbol}₂={entry['f2_mag']}{unit_label}@{entry['f2_angle']}° → "
-                        f"{var_symbol}R={entry['result']['mag']:.2f}{unit_label}@{entry['result']['angle']:.2f}°"
-                    )
+                # Only the last 10 entries are shown, so take them straight
+                # off the deque instead of materializing the whole history
+                recent = st.session_state.history.get_last(10)
+                total = len(st.session_state.history)
+                # One st.code element for the whole list instead of one
+                # st.text round trip per entry
+                lines = [
+                    f"{total-i}. {var_symbol}₁={entry['f1_mag']}{unit_label}@{entry['f1_angle']}° | "
+                    f"{var_symbol}₂={entry['f2_mag']}{unit_label}@{entry['f2_angle']}° → "
+                    f"{var_symbol}R={entry['result']['mag']:.2f}{unit_label}@{entry['result']['angle']:.2f}°"
+                    for i, entry in enumerate(reversed(recent))
+                ]
+                st.code("\n".join(lines), language=None)
     
     except ValueError as e:
         st.error(f"Error: {e}")
@@ -574,88 +761,12 @@ elif st.session_state.get('show_result') and 'last_result' in st.session_state:
     st.subheader("Vector Visualization")
     st.info(f"🔹 **Method:** {method_to_use}")
     
-    fig = Figure(figsize=(12, 7), dpi=100, facecolor=st.session_state.theme.background_color)
-    ax = fig.add_subplot(111, facecolor=st.session_state.theme.background_color)
-    
-    # Compute max_val from saved vectors and r
-    all_vals = [0]
-    for v in vector_list:
-        all_vals.extend([abs(v.x), abs(v.y)])
-    all_vals.extend([abs(r.x), abs(r.y)])
-    max_val = max(all_vals) if all_vals else 1.0
-    
-    colors = ['#5B8DEE', '#FF6B6B', '#9B59B6', '#F39C12', '#1ABC9C', '#E74C3C', '#3498DB', '#2ECC71', '#E67E22', '#95A5A6']
-    
-    if method_to_use == "Parallelogram" and len(vector_list) >= 2:
-        f1, f2 = vector_list[0], vector_list[1]
-        f1_cm = f1.mag / scale_to_use
-        f2_cm = f2.mag / scale_to_use
-        r_cm = r.mag / scale_to_use
-        draw_vector_with_labels(ax, 0, 0, f1.x, f1.y, colors[0], f'{var_symbol}₁', f1.mag, f1.angle, f1_cm, max_val, theme=st.session_state.theme, unit=unit_label)
-        draw_vector_with_labels(ax, 0, 0, f2.x, f2.y, colors[1], f'{var_symbol}₂', f2.mag, f2.angle, f2_cm, max_val, theme=st.session_state.theme, unit=unit_label)
-        draw_vector_with_labels(ax, 0, 0, r.x, r.y, '#28A745', f'{var_symbol}R', r.mag, r.angle, r_cm, max_val, width=0.004, highlight=True, theme=st.session_state.theme, unit=unit_label)
-        draw_angle_arc(ax, f1.angle, colors[0], max_val, ARC_F1_RADIUS_RATIO, theme=st.session_state.theme)
-        draw_angle_arc(ax, f2.angle, colors[1], max_val, ARC_F2_RADIUS_RATIO, theme=st.session_state.theme)
-    else:
-        # Polygon display
-        cumulative_x, cumulative_y = 0.0, 0.0
-        for i, v in enumerate(vector_list):
-            color = colors[i % len(colors)]
-            ax.quiver(cumulative_x, cumulative_y, v.x, v.y, angles='xy', scale_units='xy', scale=1, color=color, width=0.003, zorder=3)
-            mid_x = cumulative_x + v.x * 0.5
-            mid_y = cumulative_y + v.y * 0.5
-            label_rotation = 180 if (v.angle > 90 and v.angle < 270) else 0
-            ax.text(mid_x, mid_y, f'{var_symbol}{chr(0x2080 + i + 1) if i < 10 else str(i+1)}', fontsize=10, color=color, fontweight='bold', ha='center', va='center', zorder=10, rotation=label_rotation)
-            cumulative_x += v.x
-            cumulative_y += v.y
-        # Draw resultant
-        ax.quiver(0, 0, r.x, r.y, angles='xy', scale_units='xy', scale=1, color='#28A745', width=0.004, label=f'{var_symbol}R = {r.mag:.2f}{unit_label}, θ = {r.angle:.2f}°', zorder=5)
-        r_label_x = r.x * 0.35
-        r_label_y = r.y * 0.35
-        fr_bbox = dict(boxstyle='round,pad=0.25', facecolor='none', edgecolor='#28A745', linewidth=1.5)
-        fr_text = ax.text(r_label_x, r_label_y, f'{var_symbol}R', fontsize=12, color='black', fontweight='bold', ha='center', va='center', zorder=12, bbox=fr_bbox)
-        
-    # Add resultant angle arc emphasis
-    draw_angle_arc(ax, r.angle, '#28A745', max_val, ARC_FR_RADIUS_RATIO, linewidth=2.5, highlight=True, theme=st.session_state.theme)
-    
-    # Styling and axes
-    x_vals = [0, r.x]
-    y_vals = [0, r.y]
-    cumulative_x, cumulative_y = 0.0, 0.0
-    for v in vector_list:
-        x_vals.extend([v.x, cumulative_x])
-        y_vals.extend([v.y, cumulative_y])
-        cumulative_x += v.x
-        cumulative_y += v.y
-    x_min, x_max = min(x_vals), max(x_vals)
-    y_min, y_max = min(y_vals), max(y_vals)
-    padding = max_val * PADDING_RATIO
-    min_neg_space = max_val * MIN_NEGATIVE_SPACE_RATIO
-    ax.set_xlim(min(x_min - padding, -min_neg_space), x_max + padding)
-    ax.set_ylim(min(y_min - padding, -min_neg_space), y_max + padding)
-    ax.set_aspect('equal')
-    ax.set_facecolor(st.session_state.theme.background_color)
-    ax.grid(True, alpha=0.3, color=st.session_state.theme.grid_color, linestyle='-', linewidth=0.5)
-    ax.axhline(y=0, color=st.session_state.theme.grid_color, linewidth=1.5, zorder=2)
-    ax.axvline(x=0, color=st.session_state.theme.grid_color, linewidth=1.5, zorder=2)
-    # Map quantity type to variable symbol
-    var_symbols = {
-        "Force": "F",
-        "Displacement": "d",
-        "Velocity": "V",
-        "Acceleration": "a"
-    }
-    var_symbol = var_symbols.get(quantity, "F")
-    ax.set_xlabel(f'{var_symbol}ₓ ({unit_label})', fontsize=11, color=st.session_state.theme.text_color, fontweight='600')
-    ax.set_ylabel(f'{var_symbol}ᵧ ({unit_label})', fontsize=11, color=st.session_state.theme.text_color, fontweight='600')
-    ax.set_title('Vector Addition Visualization', fontsize=13, fontweight='bold', color=st.session_state.theme.text_color, pad=15)
-    ax.tick_params(colors=st.session_state.theme.text_color)
-
-    # Scale annotation
-    ax.text(0.02, 0.98, f'Scale: 1 cm = {scale_to_use} {unit_label}', transform=ax.transAxes, fontsize=11, color=st.session_state.theme.text_color, ha='left', va='top', zorder=10, bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.8, edgecolor=st.session_state.theme.grid_color))
-
-    fig.tight_layout()
-    st.pyplot(fig, width='stretch')
+    # Same cached renderer as the Calculate branch; on an unchanged result
+    # this is a byte-cache hit, not a matplotlib render
+    vectors_key = tuple((v.x, v.y, v.mag, v.angle) for v in vector_list)
+    r_key = (r.x, r.y, r.mag, r.angle)
+    png = _render_figure(vectors_key, r_key, scale_to_use, method_to_use, unit_label, var_symbol)
+    st.image(png, width='stretch')
 
     # Quick Inputs below preview
     st.divider()
@@ -674,83 +785,21 @@ elif st.session_state.get('show_result') and 'last_result' in st.session_state:
     st.button("Apply Inline Changes", type="primary", use_container_width=True, on_click=_apply_inline_changes)
 
 else:
-    # Live preview: plot current forces only (no FR) for visualization
-    from vector_addition import VectorData
-    vector_list = []
-    for i, (mag, angle) in enumerate(forces):
-        angle_rad = np.radians(angle)
-        vx = mag * np.cos(angle_rad)
-        vy = mag * np.sin(angle_rad)
-        vector_list.append(VectorData(vx, vy, mag, angle))
-    
-    st.subheader("Live Preview (FR appears after Calculate)")
-    fig = Figure(figsize=(12, 7), dpi=100, facecolor=st.session_state.theme.background_color)
-    ax = fig.add_subplot(111, facecolor=st.session_state.theme.background_color)
-
-    # Determine scale from forces only
-    max_val = max([abs(v.x) for v in vector_list] + [abs(v.y) for v in vector_list] + [1e-6])
-    colors = ['#5B8DEE', '#FF6B6B', '#9B59B6', '#F39C12', '#1ABC9C', '#E74C3C', '#3498DB', '#2ECC71', '#E67E22', '#95A5A6']
-
-    if method == "Parallelogram":
-        for i, v in enumerate(vector_list[:2]):
-            v_cm = v.mag / scale if scale else 0
-            draw_vector_with_labels(ax, 0, 0, v.x, v.y, colors[i % len(colors)], f'{var_symbol}{chr(0x2080 + i + 1) if i < 10 else str(i+1)}', v.mag, v.angle, v_cm, max_val, theme=st.session_state.theme, unit=unit_label)
-            draw_angle_arc(ax, v.angle, colors[i % len(colors)], max_val, ARC_F1_RADIUS_RATIO if i == 0 else ARC_F2_RADIUS_RATIO, theme=st.session_state.theme)
-    else:
-        cumulative_x, cumulative_y = 0.0, 0.0
-        for i, v in enumerate(vector_list):
-            color = colors[i % len(colors)]
-            ax.quiver(cumulative_x, cumulative_y, v.x, v.y, angles='xy', scale_units='xy', scale=1, color=color, width=0.003, zorder=3)
-            mid_x = cumulative_x + v.x * 0.5
-            mid_y = cumulative_y + v.y * 0.5
-            label_rotation = 180 if (v.angle > 90 and v.angle < 270) else 0
-            ax.text(mid_x, mid_y, f'{var_symbol}{chr(0x2080 + i + 1) if i < 10 else str(i+1)}', fontsize=10, color=color, fontweight='bold', ha='center', va='center', zorder=10, rotation=label_rotation)
-            cumulative_x += v.x
-            cumulative_y += v.y
-
-    # Axes and styling
-    x_vals = [0]
-    y_vals = [0]
-    cumulative_x, cumulative_y = 0.0, 0.0
-    for v in vector_list:
-        x_vals.extend([v.x, cumulative_x])
-        y_vals.extend([v.y, cumulative_y])
-        cumulative_x += v.x
-        cumulative_y += v.y
-    x_min, x_max = min(x_vals), max(x_vals)
-    y_min, y_max = min(y_vals), max(y_vals)
-    padding = max_val * PADDING_RATIO
-    min_neg_space = max_val * MIN_NEGATIVE_SPACE_RATIO
-    ax.set_xlim(min(x_min - padding, -min_neg_space), x_max + padding)
-    ax.set_ylim(min(y_min - padding, -min_neg_space), y_max + padding)
-    ax.set_aspect('equal')
-    ax.set_facecolor(st.session_state.theme.background_color)
-    ax.grid(True, alpha=0.3, color=st.session_state.theme.grid_color, linestyle='-', linewidth=0.5)
-    ax.axhline(y=0, color=st.session_state.theme.grid_color, linewidth=1.5, zorder=2)
-    ax.axvline(x=0, color=st.session_state.theme.grid_color, linewidth=1.5, zorder=2)
-    # Map quantity type to variable symbol
-    var_symbols = {
-        "Force": "F",
-        "Displacement": "d",
-        "Velocity": "V",
-        "Acceleration": "a"
-    }
-    var_symbol = var_symbols.get(quantity, "F")
-    ax.set_xlabel(f'{var_symbol}ₓ ({unit_label})', fontsize=11, color=st.session_state.theme.text_color, fontweight='600')
-    ax.set_ylabel(f'{var_symbol}ᵧ ({unit_label})', fontsize=11, color=st.session_state.theme.text_color, fontweight='600')
-    ax.set_title('Vector Preview', fontsize=13, fontweight='bold', color=st.session_state.theme.text_color, pad=15)
-    ax.tick_params(colors=st.session_state.theme.text_color)
+    # Live preview: plot current forces only (no FR) for visualization.
+    # This branch reruns on every input edit, so it stays off matplotlib
+    # entirely and emits a hand-built inline SVG instead
+    mags, angs = np.asarray(forces, dtype=np.float64).T
+    rads = np.deg2rad(angs)
+    vxs = mags * np.cos(rads)
+    vys = mags * np.sin(rads)
 
-    # Scale annotation
-    ax.text(0.02, 0.98, f'Scale: 1 cm = {scale} {unit_label}', transform=ax.transAxes, fontsize=11, color=st.session_state.theme.text_color, ha='left', va='top', zorder=10, bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.8, edgecolor=st.session_state.theme.grid_color))
-
-    fig.tight_layout()
-    st.pyplot(fig, width='stretch')
+    st.subheader("Live Preview (FR appears after Calculate)")
+    st.markdown(_svg_preview(vxs, vys, method, var_symbol), unsafe_allow_html=True)
 
     # Quick Inputs below plot
     st.divider()
     st.subheader("Quick Inputs")
-    n_q = st.session_state.get('num_forces', len(vector_list))
+    n_q = st.session_state.get('num_forces', len(forces))
     for i in range(1, n_q + 1):
         st.session_state.setdefault(f'inline_f{i}_mag', st.session_state.get(f'f{i}_mag', 0.0))
         st.session_state.setdefault(f'inline_f{i}_angle', st.session_state.get(f'f{i}_angle', 0.0))
@@ -5,9 +5,8 @@ Mobile-friendly with smooth arrow animations
 """
 
 import streamlit as st
-import plotly.graph_objects as go
 import numpy as np
-from vector_addition import add_vectors, ColorTheme, VectorHistory, generate_solution_text
+from vector_addition import add_vectors, ColorTheme, VectorData, VectorHistory, generate_solution_text
 
 # Page config
 st.set_page_config(
@@ -24,8 +23,8 @@ if 'theme' not in st.session_state:
 if 'show_result' not in st.session_state:
     st.session_state.show_result = False
 
-# Custom CSS
-st.markdown("""
+# Static page chrome, built once at import time rather than per rerun
+_CSS = """
 <style>
     /* Global font */
 html, body, [class*="css"], .stMarkdown, .stText, .stButton button, .stSelectbox, .stSlider, .stNumberInput, .stRadio {
@@ -65,118 +64,175 @@ h1, h2, h3, h4, h5, h6 {
     .manual-card hr { border: none; border-top: 1px solid #C9B99A; margin: 10px 0 14px; }
     .manual-callout { font-style: italic; color: #5B4636; }
 </style>
-""", unsafe_allow_html=True)
-
-def create_arc(angle_deg, radius, color, num_points=50):
-    """Create arc points for angle annotation"""
-    if abs(angle_deg) < 0.01:
-        return [], []
-    theta = np.linspace(0, np.radians(angle_deg), num_points)
-    x = radius * np.cos(theta)
-    y = radius * np.sin(theta)
-    return x.tolist(), y.tolist()
-
-def create_animated_vector_plot(f1, f2, r, scale, animate=True, unit: str = 'N', quantity: str = 'Force'):
+"""
+
+_MANUAL_HTML = """
+<div class="manual-card">
+<p>
+  <b>Developer</b>: <a href="https://www.tiktok.com/@k00gs" target="_blank" rel="noopener noreferrer">Mar Luar Igot</a><br/>
+  <b>Co-developer</b>: Alexander Miranda
+</p>
+<hr/>
+<h2>1. Introduction</h2>
+<p>This animated variant shows vectors and arcs smoothly for clearer understanding. The underlying math is unchanged: only units differ by the selected Quantity Type.</p>
+<hr/>
+
+<h2>2. Page Layout</h2>
+<h3>2.1 Sidebar — Settings</h3>
+<ul>
+  <li><b>Quantity Type</b>: Select the vector type. Units update throughout.</li>
+  <li><b>Scale</b>: Sets drawing scale (e.g., 1 cm = 10 N) used for labels and the scale badge.</li>
+  <li><b>F₁ / F₂</b>: Magnitude and angle for each vector.</li>
+  <li><b>Controls</b>: 
+    <ul>
+      <li><b>Calculate</b> — Computes and displays FR.</li>
+      <li><b>Animate</b> — Toggles the animation playback.</li>
+      <li><b>Show Steps</b> — Displays the analytical solution.</li>
+    </ul>
+  </li>
+</ul>
+
+<h3>2.2 Main Area — Visualization</h3>
+<ul>
+  <li><b>Live Preview</b>: While editing inputs, only the entered vectors are drawn. FR is hidden until you click <b>Calculate</b>.</li>
+  <li><b>Animation</b>: Press Calculate to animate F₁, F₂, FR, construction lines, and the angle arcs.</li>
+  <li><b>Resultant Angle (θR)</b>: Emphasized with a clean label; negative angles indicate clockwise rotation (FRᵧ &lt; 0).</li>
+  <li><b>Scale Badge</b>: Top-left label shows the current scale.</li>
+</ul>
+<hr/>
+
+<h2>3. Results & Steps</h2>
+<ul>
+  <li><b>Resultant Panel</b>: Magnitude, length in cm (by scale), and angle.</li>
+  <li><b>Analytical Solution</b>: Includes sign explanations when components are negative and which contributions dominate.</li>
+</ul>
+<hr/>
+
+<h2>4. Tips</h2>
+<ul>
+  <li>Use smaller scales for large magnitudes to keep the drawing readable.</li>
+  <li>Angles near 90°/270° make x-components ≈ 0; near 0°/180° make y-components ≈ 0.</li>
+</ul>
+</div>
+"""
+
+st.markdown(_CSS, unsafe_allow_html=True)
+
+# Quantity-type lookups, shared by the figure builder and the sidebar
+_VAR_SYMBOLS = {
+    "Force": "F",
+    "Displacement": "d",
+    "Velocity": "V",
+    "Acceleration": "a",
+}
+_UNITS = {
+    "Force": "N",
+    "Displacement": "m",
+    "Velocity": "m/s",
+    "Acceleration": "m/s²",
+}
+
+# Shared unit grid for arc sampling: scaling it by the target angle replaces
+# a fresh np.linspace allocation per arc
+_UNIT_THETA = np.linspace(0.0, 1.0, 50)
+
+# plotly is loaded lazily: importing graph_objects pulls in 100+ submodules,
+# and reruns before the first Calculate (sidebar edits, live preview) never
+# touch it
+go = None
+
+def _load_plotly():
+    """Import plotly on first figure build."""
+    global go
+    if go is None:
+        import plotly.graph_objects as _go
+        go = _go
+        # orjson serializes the frame-heavy figures several times faster
+        # than the stdlib encoder, but it is an optional dependency: use it
+        # when present, fall back silently otherwise
+        try:
+            import orjson  # noqa: F401
+            import plotly.io as _pio
+            _pio.json.config.default_engine = 'orjson'
+        except ImportError:
+            pass
+
+def create_arcs(angles_deg, radii):
+    """Sample several arcs at once.
+
+    One broadcast over the shared unit grid replaces a linspace/cos/sin
+    triple per arc; callers slice the returned 2D arrays by row.
+    """
+    theta = np.deg2rad(np.asarray(angles_deg, dtype=np.float64))[:, None] * _UNIT_THETA[None, :]
+    radii = np.asarray(radii, dtype=np.float64)[:, None]
+    return radii * np.cos(theta), radii * np.sin(theta)
+
+def _preview_svg(xs, ys, mags, angles, var_symbol, unit_label):
+    """Draw the two-vector live preview as an inline SVG string.
+
+    The preview reruns on every sidebar edit, and a full Plotly figure per
+    keystroke was the dominant interactive cost; two arrows and the axes
+    come to a few SVG elements and a payload of under a kilobyte.
+    """
+    span = max(max(abs(x) for x in xs), max(abs(y) for y in ys), 1e-6) * 1.3
+    size = 2.0 * span
+    sw = span / 150  # hairline stroke in user units
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" '
+        f'viewBox="{-span:.4g} {-span:.4g} {size:.4g} {size:.4g}" '
+        f'width="100%" style="max-height:480px;background:#F0F8FF">',
+        f'<line x1="{-span:.4g}" y1="0" x2="{span:.4g}" y2="0" stroke="gray" stroke-width="{sw:.4g}"/>',
+        f'<line x1="0" y1="{-span:.4g}" x2="0" y2="{span:.4g}" stroke="gray" stroke-width="{sw:.4g}"/>',
+    ]
+    head = span * 0.04
+    subscripts = ('₁', '₂')
+    for i, color in enumerate(('#5B8DEE', '#FF6B6B')):
+        # SVG y grows downward, so flip the y coordinate
+        tx, ty = xs[i], -ys[i]
+        parts.append(f'<line x1="0" y1="0" x2="{tx:.4g}" y2="{ty:.4g}" '
+                     f'stroke="{color}" stroke-width="{sw * 3:.4g}"/>')
+        norm = np.hypot(tx, ty)
+        if norm > 0:
+            # Triangular arrowhead at the tip
+            ux, uy = tx / norm, ty / norm
+            bx, by = tx - ux * head, ty - uy * head
+            px, py = -uy * head * 0.5, ux * head * 0.5
+            parts.append(f'<polygon fill="{color}" points="{tx:.4g},{ty:.4g} '
+                         f'{bx + px:.4g},{by + py:.4g} {bx - px:.4g},{by - py:.4g}"/>')
+        parts.append(f'<text x="{tx / 2:.4g}" y="{ty / 2:.4g}" fill="{color}" '
+                     f'font-size="{span * 0.06:.4g}" font-weight="bold">'
+                     f'{var_symbol}{subscripts[i]}: {mags[i]:.1f}{unit_label} @ {angles[i]:.1f}°</text>')
+    parts.append('</svg>')
+    return ''.join(parts)
+
+def create_animated_vector_plot(f1, f2, r, scale, animate=True, unit: str = 'N', quantity: str = 'Force',
+                                num_frames: int = 30):
     """Create interactive Plotly plot with animations"""
-    
-    # Map quantity type to variable symbol
-    var_symbols = {
-        "Force": "F",
-        "Displacement": "d",
-        "Velocity": "V",
-        "Acceleration": "a"
-    }
-    var_symbol = var_symbols.get(quantity, "F")
+    _load_plotly()
+
+    var_symbol = _VAR_SYMBOLS.get(quantity, "F")
     
     # Calculate display values
     max_val = max(abs(f1.x), abs(f1.y), abs(f2.x), abs(f2.y), abs(r.x), abs(r.y))
     padding = max_val * 0.3
     min_neg = max_val * 0.15
     
-    # Animation frames
-    if animate:
-        num_frames = 30
-        arc_start_frame = 20
-        frames = []
-        
-        for i in range(num_frames + 10):  # Extra frames for arc animation
-            progress = min(1.0, i / num_frames)
-            arc_progress = max(0, (i - arc_start_frame) / 10) if i >= arc_start_frame else 0
-            
-            # Eased progress
-            eased = 1 - (1 - progress) ** 3
-            arc_eased = 1 - (1 - arc_progress) ** 3
-            
-            frame_data = []
-            
-            # Vector arrows
-            for vec, color, name in [(f1, '#5B8DEE', f'{var_symbol}₁'), (f2, '#FF6B6B', f'{var_symbol}₂'), 
-                                      (r, '#28A745', f'{var_symbol}R')]:
-                width = 6 if name.endswith('R') else 4
-                frame_data.append(go.Scatter(
-                    x=[0, vec.x * eased],
-                    y=[0, vec.y * eased],
-                    mode='lines+markers',
-                    line=dict(color=color, width=width),
-                    marker=dict(size=[8, 12], color=color, symbol=['circle', 'arrow-bar-up']),
-                    name=f'{name}: {vec.mag:.1f}{unit} @ {vec.angle:.1f}°',
-                    showlegend=True,
-                    hovertemplate=f'{name}<br>Magnitude: {vec.mag:.2f}{unit}<br>Angle: {vec.angle:.2f}°<extra></extra>'
-                ))
-            
-            # Construction lines (show after arrows complete)
-            if progress >= 0.95:
-                frame_data.extend([
-                    go.Scatter(x=[f1.x, r.x], y=[f1.y, r.y], mode='lines',
-                              line=dict(color='#FF6B6B', dash='dash', width=1.5),
-                              showlegend=False, hoverinfo='skip', opacity=0.4),
-                    go.Scatter(x=[f2.x, r.x], y=[f2.y, r.y], mode='lines',
-                              line=dict(color='#5B8DEE', dash='dash', width=1.5),
-                              showlegend=False, hoverinfo='skip', opacity=0.4)
-                ])
-            
-            # Angle arcs (animate after arrows)
-            if arc_eased > 0:
-                for vec, color, radius_mult, name in [(f1, '#5B8DEE', 0.15, 'θ₁'), 
-                                                       (f2, '#FF6B6B', 0.20, 'θ₂'),
-                                                       (r, '#28A745', 0.25, 'θR')]:
-                    arc_x, arc_y = create_arc(vec.angle * arc_eased, max_val * radius_mult, color)
-                    if arc_x:
-                        frame_data.append(go.Scatter(
-                            x=arc_x, y=arc_y, mode='lines',
-                            line=dict(color=color, width=2.5 if name == 'θR' else 2),
-                            showlegend=False, hoverinfo='skip'
-                        ))
-                        # Arc label
-                        if arc_eased > 0.5:
-                            label_angle = vec.angle * arc_eased * 1.1
-                            label_r = max_val * radius_mult * 1.15
-                            label_x = label_r * np.cos(np.radians(label_angle))
-                            label_y = label_r * np.sin(np.radians(label_angle))
-                            frame_data.append(go.Scatter(
-                                x=[label_x], y=[label_y], mode='text',
-                                text=[f"{vec.angle * arc_eased:.1f}°"],
-                                textfont=dict(size=11, color=color, family='Arial Black'),
-                                showlegend=False, hoverinfo='skip'
-                            ))
-            
-            frames.append(go.Frame(data=frame_data, name=str(i)))
-    
-    # Final static frame
+    # Final static scene; with animation enabled these traces double as the
+    # base that the sparse frames patch
     static_data = []
-    
+
     # Vectors
-    for vec, color, name in [(f1, '#5B8DEE', f'{var_symbol}₁'), (f2, '#FF6B6B', f'{var_symbol}₂'), (r, '#28A745', f'{var_symbol}R')]:
+    for vec, color, name in [(f1, '#5B8DEE', f'{var_symbol}\u2081'), (f2, '#FF6B6B', f'{var_symbol}\u2082'), (r, '#28A745', f'{var_symbol}R')]:
         width = 6 if name.endswith('R') else 4
         static_data.append(go.Scatter(
             x=[0, vec.x], y=[0, vec.y],
             mode='lines+markers',
             line=dict(color=color, width=width),
             marker=dict(size=[8, 12], color=color, symbol=['circle', 'arrow-bar-up']),
-            name=f'{name}: {vec.mag:.1f}{unit} @ {vec.angle:.1f}°',
-            hovertemplate=f'{name}<br>Magnitude: {vec.mag:.2f}{unit}<br>Angle: {vec.angle:.2f}°<extra></extra>'
+            name=f'{name}: {vec.mag:.1f}{unit} @ {vec.angle:.1f}\u00b0',
+            hovertemplate=f'{name}<br>Magnitude: {vec.mag:.2f}{unit}<br>Angle: {vec.angle:.2f}\u00b0<extra></extra>'
         ))
-    
+
     # Construction lines
     static_data.extend([
         go.Scatter(x=[f1.x, r.x], y=[f1.y, r.y], mode='lines',
@@ -186,67 +242,153 @@ def create_animated_vector_plot(f1, f2, r, scale, animate=True, unit: str = 'N',
                   line=dict(color='#5B8DEE', dash='dash', width=1.5),
                   showlegend=False, hoverinfo='skip', opacity=0.4)
     ])
-    
-    # Arcs
-    for vec, color, radius_mult in [(f1, '#5B8DEE', 0.15), (f2, '#FF6B6B', 0.20), (r, '#28A745', 0.25)]:
-        arc_x, arc_y = create_arc(vec.angle, max_val * radius_mult, color)
-        if arc_x:
-            static_data.append(go.Scatter(
-                x=arc_x, y=arc_y, mode='lines',
-                line=dict(color=color, width=2.5 if color == '#28A745' else 2),
-                showlegend=False, hoverinfo='skip'
-            ))
-            # Arc label
-            label_angle = vec.angle * 1.1
-            label_r = max_val * radius_mult * 1.15
-            label_x = label_r * np.cos(np.radians(label_angle))
-            label_y = label_r * np.sin(np.radians(label_angle))
-            static_data.append(go.Scatter(
-                x=[label_x], y=[label_y], mode='text',
-                text=[f"{vec.angle:.1f}°"],
-                textfont=dict(size=11, color=color, family='Arial Black'),
-                showlegend=False, hoverinfo='skip'
-            ))
-    
+
+    # Arcs, all sampled in one batched trig call; near-zero angles get no
+    # trace at all (in the base or in any frame)
+    arc_specs = ((f1, '#5B8DEE', 0.15, '\u03b8\u2081'),
+                 (f2, '#FF6B6B', 0.20, '\u03b8\u2082'),
+                 (r, '#28A745', 0.25, '\u03b8R'))
+    arc_angles = np.array([f1.angle, f2.angle, r.angle])
+    arc_radii = max_val * np.array([0.15, 0.20, 0.25])
+    arc_xs, arc_ys = create_arcs(arc_angles, arc_radii)
+    for j, (vec, color, radius_mult, name) in enumerate(arc_specs):
+        if abs(vec.angle) < 0.01:
+            continue
+        static_data.append(go.Scatter(
+            x=arc_xs[j], y=arc_ys[j], mode='lines',
+            line=dict(color=color, width=2.5 if name == '\u03b8R' else 2),
+            showlegend=False, hoverinfo='skip'
+        ))
+        # Arc label
+        label_angle = vec.angle * 1.1
+        label_r = max_val * radius_mult * 1.15
+        static_data.append(go.Scatter(
+            x=[label_r * np.cos(np.radians(label_angle))],
+            y=[label_r * np.sin(np.radians(label_angle))], mode='text',
+            text=[f"{vec.angle:.1f}\u00b0"],
+            textfont=dict(size=11, color=color, family='Arial Black'),
+            showlegend=False, hoverinfo='skip'
+        ))
+
+    # Animation frames: sparse per-trace patches (x/y, plus text for the
+    # labels) that Plotly merges into the styled base traces by index,
+    # instead of re-emitting every fully specified trace in every frame
+    frames = None
+    if animate:
+        # Arc sweep starts at 2/3 of the arrow animation and runs through
+        # the tail frames; at the default 30 this matches the original
+        # 30+10 frame schedule
+        tail = max(1, num_frames // 3)
+        arc_start_frame = num_frames * 2 // 3
+
+        # All easing curves in a handful of vectorized expressions instead of
+        # scalar math per frame
+        idx = np.arange(num_frames + tail)  # Extra frames for arc animation
+        progress_arr = np.minimum(1.0, idx / num_frames)
+        eased_arr = 1 - (1 - progress_arr) ** 3
+        # Clamped at 1 so the arc settles on the true angle (the unclamped
+        # tail frames used to sweep past it) and the animation ends exactly
+        # on the static scene
+        arc_progress_arr = np.clip((idx - arc_start_frame) / tail, 0.0, 1.0)
+        arc_eased_arr = 1 - (1 - arc_progress_arr) ** 3
+
+        # Arc geometry for every frame at once: one (frames, 3, 50) broadcast
+        # replaces the per-frame trig call, leaving the loop to slice rows
+        # and assemble dicts
+        eased_angles = arc_eased_arr[:, None] * arc_angles[None, :]
+        theta_all = np.deg2rad(eased_angles)[:, :, None] * _UNIT_THETA[None, None, :]
+        arc_x_all = arc_radii[None, :, None] * np.cos(theta_all)
+        arc_y_all = arc_radii[None, :, None] * np.sin(theta_all)
+        label_theta = np.deg2rad(eased_angles * 1.1)
+        label_x_all = arc_radii[None, :] * 1.15 * np.cos(label_theta)
+        label_y_all = arc_radii[None, :] * 1.15 * np.sin(label_theta)
+
+        trace_idx = list(range(len(static_data)))
+        frames = []
+        for i in range(num_frames + tail):
+            eased = eased_arr[i]
+            arc_eased = arc_eased_arr[i]
+
+            # Vector arrows
+            frame_data = [dict(x=[0, vec.x * eased], y=[0, vec.y * eased])
+                          for vec in (f1, f2, r)]
+
+            # Construction lines (show after arrows complete)
+            if progress_arr[i] >= 0.95:
+                frame_data.append(dict(x=[f1.x, r.x], y=[f1.y, r.y]))
+                frame_data.append(dict(x=[f2.x, r.x], y=[f2.y, r.y]))
+            else:
+                frame_data.append(dict(x=[], y=[]))
+                frame_data.append(dict(x=[], y=[]))
+
+            # Angle arcs (animate after arrows): geometry is row slices of
+            # the precomputed frame stacks
+            for j, (vec, color, radius_mult, name) in enumerate(arc_specs):
+                if abs(vec.angle) < 0.01:
+                    continue  # no base trace to patch
+                if arc_eased > 0 and abs(vec.angle * arc_eased) >= 0.01:
+                    frame_data.append(dict(x=arc_x_all[i, j], y=arc_y_all[i, j]))
+                else:
+                    frame_data.append(dict(x=[], y=[]))
+                # Arc label
+                if arc_eased > 0.5:
+                    frame_data.append(dict(
+                        x=[label_x_all[i, j]], y=[label_y_all[i, j]],
+                        text=[f"{vec.angle * arc_eased:.1f}\u00b0"]))
+                else:
+                    frame_data.append(dict(x=[], y=[], text=[]))
+
+            # Plain dicts: go.Frame would validate each patch eagerly, and the
+            # Figure constructor accepts dict frames as-is
+            frames.append(dict(data=frame_data, name=str(i), traces=trace_idx))
+
     # Create figure
     fig = go.Figure(data=static_data, frames=frames if animate else None)
 
-    # Add emphasized FR label annotation at ~35% along resultant
-    fr_label_x = r.x * 0.35
-    fr_label_y = r.y * 0.35
-    fig.add_annotation(
-        x=fr_label_x, y=fr_label_y, xref='x', yref='y', text=f'{var_symbol}R',
-        showarrow=True, arrowhead=2, arrowsize=1, arrowwidth=1.5,
-        ax=0, ay=0,
-        font=dict(size=12, color='black', family='Times New Roman, Times, Liberation Serif, Nimbus Roman, DejaVu Serif, serif'),
-        align='center',
-        bgcolor='rgba(0,0,0,0)',  # transparent background
-        bordercolor='#28A745', borderwidth=1
-    )
-    
     # Layout
     x_min = min(0, f1.x, f2.x, r.x)
     x_max = max(0, f1.x, f2.x, r.x)
     y_min = min(0, f1.y, f2.y, r.y)
     y_max = max(0, f1.y, f2.y, r.y)
 
-    # Emphasize resultant angle label
+    # Emphasized resultant angle label position
     ra_label_angle = r.angle * 1.1
     ra_label_radius = max_val * 0.25 * 1.2
     ra_label_x = ra_label_radius * np.cos(np.radians(ra_label_angle))
     ra_label_y = ra_label_radius * np.sin(np.radians(ra_label_angle))
 
-    fig.add_annotation(
-        x=ra_label_x, y=ra_label_y, xref='x', yref='y',
-        text=f"θR = {r.angle:.1f}°",
-        showarrow=False,
-        font=dict(size=12, color='black', family='Times New Roman, Times, Liberation Serif, Nimbus Roman, DejaVu Serif, serif'),
-        align='center',
-        bgcolor='rgba(0,0,0,0)',
-        bordercolor='#28A745', borderwidth=1
-    )
-    
+    serif = 'Times New Roman, Times, Liberation Serif, Nimbus Roman, DejaVu Serif, serif'
+    # All three annotations (FR label at ~35% along the resultant, the
+    # emphasized angle label, the scale badge) in one batch; each
+    # add_annotation call diffs the whole layout again
+    annotations = [
+        dict(
+            x=r.x * 0.35, y=r.y * 0.35, xref='x', yref='y', text=f'{var_symbol}R',
+            showarrow=True, arrowhead=2, arrowsize=1, arrowwidth=1.5,
+            ax=0, ay=0,
+            font=dict(size=12, color='black', family=serif),
+            align='center',
+            bgcolor='rgba(0,0,0,0)',  # transparent background
+            bordercolor='#28A745', borderwidth=1
+        ),
+        dict(
+            x=ra_label_x, y=ra_label_y, xref='x', yref='y',
+            text=f"θR = {r.angle:.1f}°",
+            showarrow=False,
+            font=dict(size=12, color='black', family=serif),
+            align='center',
+            bgcolor='rgba(0,0,0,0)',
+            bordercolor='#28A745', borderwidth=1
+        ),
+        dict(
+            xref='paper', yref='paper', x=0.01, y=0.99, text=f'Scale: 1 cm = {scale} {unit}',
+            showarrow=False, align='left', bgcolor='rgba(255,255,255,0.8)',
+            bordercolor='lightgray', borderwidth=1, font=dict(size=12)
+        ),
+    ]
+
     fig.update_layout(
+        annotations=annotations,
         title="Vector Addition Visualization",
         xaxis=dict(
             range=[min(x_min - padding, -min_neg), x_max + padding],
@@ -286,73 +428,28 @@ font=dict(family='Times New Roman, Times, Liberation Serif, Nimbus Roman, DejaVu
         )
         # Auto-play on load
         fig.layout.updatemenus[0].buttons[0].args[1]['transition'] = {'duration': 0}
-    
-    # Add scale annotation (top-left)
-    fig.add_annotation(
-        xref='paper', yref='paper', x=0.01, y=0.99, text=f'Scale: 1 cm = {scale} {unit}',
-        showarrow=False, align='left', bgcolor='rgba(255,255,255,0.8)',
-        bordercolor='lightgray', borderwidth=1, font=dict(size=12)
-    )
     return fig
 
+@st.cache_data(max_entries=32, show_spinner=False)
+def _cached_vector_plot(f1_key, f2_key, r_key, scale, animate, unit, quantity, num_frames=30):
+    """Build (and cache) the animated figure for one set of inputs.
+
+    Constructing the ~40 Plotly frames is the dominant per-rerun cost;
+    caching on the vector tuples means reruns from unrelated widgets (Show
+    Steps, history) reuse the figure instead of rebuilding it.
+    """
+    f1, f2, r = VectorData(*f1_key), VectorData(*f2_key), VectorData(*r_key)
+    return create_animated_vector_plot(f1, f2, r, scale, animate,
+                                       unit=unit, quantity=quantity,
+                                       num_frames=num_frames)
+
 # Header
 st.title("Vector Addition Calculator")
 st.markdown("Visualize and analyze force vectors with **smooth animations**")
 
 # Start Guide — Classic Manual
 with st.expander("Start Guide — User Manual", expanded=True):
-    st.markdown(
-        """
-<div class="manual-card">
-<p>
-  <b>Developer</b>: <a href="https://www.tiktok.com/@k00gs" target="_blank" rel="noopener noreferrer">Mar Luar Igot</a><br/>
-  <b>Co-developer</b>: Alexander Miranda
-</p>
-<hr/>
-<h2>1. Introduction</h2>
-<p>This animated variant shows vectors and arcs smoothly for clearer understanding. The underlying math is unchanged: only units differ by the selected Quantity Type.</p>
-<hr/>
-
-<h2>2. Page Layout</h2>
-<h3>2.1 Sidebar — Settings</h3>
-<ul>
-  <li><b>Quantity Type</b>: Select the vector type. Units update throughout.</li>
-  <li><b>Scale</b>: Sets drawing scale (e.g., 1 cm = 10 N) used for labels and the scale badge.</li>
-  <li><b>F₁ / F₂</b>: Magnitude and angle for each vector.</li>
-  <li><b>Controls</b>: 
-    <ul>
-      <li><b>Calculate</b> — Computes and displays FR.</li>
-      <li><b>Animate</b> — Toggles the animation playback.</li>
-      <li><b>Show Steps</b> — Displays the analytical solution.</li>
-    </ul>
-  </li>
-</ul>
-
-<h3>2.2 Main Area — Visualization</h3>
-<ul>
-  <li><b>Live Preview</b>: While editing inputs, only the entered vectors are drawn. FR is hidden until you click <b>Calculate</b>.</li>
-  <li><b>Animation</b>: Press Calculate to animate F₁, F₂, FR, construction lines, and the angle arcs.</li>
-  <li><b>Resultant Angle (θR)</b>: Emphasized with a clean label; negative angles indicate clockwise rotation (FRᵧ &lt; 0).</li>
-  <li><b>Scale Badge</b>: Top-left label shows the current scale.</li>
-</ul>
-<hr/>
-
-<h2>3. Results & Steps</h2>
-<ul>
-  <li><b>Resultant Panel</b>: Magnitude, length in cm (by scale), and angle.</li>
-  <li><b>Analytical Solution</b>: Includes sign explanations when components are negative and which contributions dominate.</li>
-</ul>
-<hr/>
-
-<h2>4. Tips</h2>
-<ul>
-  <li>Use smaller scales for large magnitudes to keep the drawing readable.</li>
-  <li>Angles near 90°/270° make x-components ≈ 0; near 0°/180° make y-components ≈ 0.</li>
-</ul>
-</div>
-""",
-        unsafe_allow_html=True,
-    )
+    st.markdown(_MANUAL_HTML, unsafe_allow_html=True)
 
 # Helper to hide result when inputs change
 def _hide_result():
@@ -371,21 +468,8 @@ with st.sidebar:
         help="Only the units change; calculations remain the same",
         on_change=_hide_result
     )
-    units_map = {
-        "Force": "N",
-        "Displacement": "m",
-        "Velocity": "m/s",
-        "Acceleration": "m/s²",
-    }
-    unit_label = units_map.get(quantity, "N")
-    # Variable symbol by quantity
-    var_symbols = {
-        "Force": "F",
-        "Displacement": "d",
-        "Velocity": "V",
-        "Acceleration": "a",
-    }
-    var_symbol = var_symbols.get(quantity, "F")
+    unit_label = _UNITS.get(quantity, "N")
+    var_symbol = _VAR_SYMBOLS.get(quantity, "F")
     
     scale = st.number_input(f"1 cm equals ({unit_label}):", min_value=0.1, value=10.0, step=0.5, on_change=_hide_result)
     st.divider()
@@ -405,6 +489,10 @@ with st.sidebar:
         calculate_btn = st.button("Calculate", use_container_width=True, type="primary")
     with col2:
         animate = st.checkbox("Animate", value=True)
+
+    # Fewer frames mean proportionally less figure-build work per Calculate
+    num_frames = st.select_slider("Animation smoothness", options=(10, 20, 30, 40),
+                                  value=30, disabled=not animate)
     
     show_solution = st.checkbox("Show Steps", value=False)
 
@@ -420,8 +508,12 @@ if calculate_btn:
         
         with col1:
             st.subheader("Vector Visualization")
-            fig = create_animated_vector_plot(f1, f2, r, scale, animate, unit=unit_label, quantity=quantity)
-            st.plotly_chart(fig, use_container_width=True)
+            fig = _cached_vector_plot((f1.x, f1.y, f1.mag, f1.angle),
+                                      (f2.x, f2.y, f2.mag, f2.angle),
+                                      (r.x, r.y, r.mag, r.angle),
+                                      scale, animate, unit_label, quantity,
+                                      num_frames)
+            st.plotly_chart(fig, use_container_width=True, key="main_vector_plot")
         
         with col2:
             st.subheader(f"Resultant ({var_symbol}R)")
@@ -463,8 +555,12 @@ elif st.session_state.get('show_result') and 'last_result' in st.session_state:
     col1, col2 = st.columns([2, 1])
     with col1:
         st.subheader("Vector Visualization")
-        fig = create_animated_vector_plot(f1, f2, r, scale_saved, animate, unit=unit_label, quantity=quantity)
-        st.plotly_chart(fig, use_container_width=True)
+        fig = _cached_vector_plot((f1.x, f1.y, f1.mag, f1.angle),
+                                  (f2.x, f2.y, f2.mag, f2.angle),
+                                  (r.x, r.y, r.mag, r.angle),
+                                  scale_saved, animate, unit_label, quantity,
+                                  num_frames)
+        st.plotly_chart(fig, use_container_width=True, key="main_vector_plot")
     with col2:
         st.subheader(f"Resultant ({var_symbol}R)")
         st.metric("Magnitude", f"{r.mag:.2f} {unit_label}")
@@ -473,8 +569,6 @@ elif st.session_state.get('show_result') and 'last_result' in st.session_state:
 else:
     # Live preview plot without FR
     st.subheader("Live Preview (FR appears after Calculate)")
-    import plotly.graph_objects as go
-    import numpy as np
 
     # Compute components
     f1_x = f1_mag * np.cos(np.radians(f1_angle))
@@ -482,46 +576,11 @@ else:
     f2_x = f2_mag * np.cos(np.radians(f2_angle))
     f2_y = f2_mag * np.sin(np.radians(f2_angle))
 
-    # Determine ranges
-    xs = [0, f1_x, f2_x]
-    ys = [0, f1_y, f2_y]
-    max_val = max([abs(x) for x in xs] + [abs(y) for y in ys] + [1e-6])
-    padding = max_val * 0.3
-    min_neg = max_val * 0.15
-
-    data = []
-    for (x, y, color, name, mag, ang) in [
-        (f1_x, f1_y, '#5B8DEE', f'{var_symbol}₁', f1_mag, f1_angle),
-        (f2_x, f2_y, '#FF6B6B', f'{var_symbol}₂', f2_mag, f2_angle)
-    ]:
-        data.append(go.Scatter(
-            x=[0, x], y=[0, y], mode='lines+markers',
-            line=dict(color=color, width=4),
-            marker=dict(size=[8, 10], color=color),
-            name=f'{name}: {mag:.1f}{unit_label} @ {ang:.1f}°'
-        ))
-
-    # Map quantity type to variable symbol
-    var_symbols = {
-        "Force": "F",
-        "Displacement": "d",
-        "Velocity": "V",
-        "Acceleration": "a"
-    }
-    var_symbol = var_symbols.get(quantity, "F")
-    
-    fig = go.Figure(data=data)
-    fig.update_layout(
-        title="Vector Preview",
-        xaxis=dict(range=[min(min(xs)-padding, -min_neg), max(xs)+padding], zeroline=True, zerolinewidth=2, zerolinecolor='gray', gridcolor='lightgray', title=f'{var_symbol}ₓ ({unit_label})'),
-        yaxis=dict(range=[min(min(ys)-padding, -min_neg), max(ys)+padding], zeroline=True, zerolinewidth=2, zerolinecolor='gray', gridcolor='lightgray', title=f'{var_symbol}ᵧ ({unit_label})', scaleanchor='x', scaleratio=1),
-        plot_bgcolor='#F0F8FF',
-        font=dict(family='Times New Roman, Times, Liberation Serif, Nimbus Roman, DejaVu Serif, serif'),
-        showlegend=True,
-        height=600,
-    )
-    fig.add_annotation(xref='paper', yref='paper', x=0.01, y=0.99, text=f'Scale: 1 cm = {scale} {unit_label}', showarrow=False, align='left', bgcolor='rgba(255,255,255,0.8)', bordercolor='lightgray', borderwidth=1, font=dict(size=12))
-    st.plotly_chart(fig, use_container_width=True)
+    st.caption(f'Scale: 1 cm = {scale} {unit_label}')
+    st.markdown(_preview_svg((f1_x, f2_x), (f1_y, f2_y),
+                             (f1_mag, f2_mag), (f1_angle, f2_angle),
+                             var_symbol, unit_label),
+                unsafe_allow_html=True)
 
     # Quick Inputs below preview (F₁ and F₂)
     st.divider()
@@ -540,14 +599,14 @@ else:
         st.number_input(f"{var_symbol}2 Angle (°)", min_value=0, max_value=360, step=1, key='inline_f2_angle', on_change=_hide_result)
 
     def _apply_inline_changes_anim():
-        try:
-            st.session_state['f1_mag'] = st.session_state.get('inline_f1_mag', 0.0)
-            st.session_state['f1_angle'] = st.session_state.get('inline_f1_angle', 0)
-            st.session_state['f2_mag'] = st.session_state.get('inline_f2_mag', 0.0)
-            st.session_state['f2_angle'] = st.session_state.get('inline_f2_angle', 0)
-            st.session_state.show_result = False
-        except Exception:
-            st.session_state.show_result = False
+        # One batched mutation instead of five individual assignments
+        st.session_state.update({
+            'f1_mag': st.session_state.get('inline_f1_mag', 0.0),
+            'f1_angle': st.session_state.get('inline_f1_angle', 0),
+            'f2_mag': st.session_state.get('inline_f2_mag', 0.0),
+            'f2_angle': st.session_state.get('inline_f2_angle', 0),
+            'show_result': False,
+        })
 
     st.button("Apply Inline Changes", type="primary", use_container_width=True, on_click=_apply_inline_changes_anim)
 
@@ -1,12 +1,42 @@
-from typing import Tuple, Optional, List, Dict, Any
-from dataclasses import dataclass, asdict
+from typing import Tuple, Optional, List, Dict, Any, Deque
+from collections import deque
+from itertools import islice
+from dataclasses import dataclass
 from datetime import datetime
 import json
-import matplotlib.pyplot as plt
+import math
 import numpy as np
 import matplotlib.patheffects as pe
 import matplotlib as mpl
 
+# Optional JIT: numba compiles the scalar math kernels below to native code
+# (cached to disk, so the compile cost is paid once per machine). Everything
+# works unchanged without it.
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Optional fast JSON: orjson serializes the history dicts several times
+# faster than the stdlib and emits bytes directly. Stdlib json is the
+# drop-in fallback.
+try:
+    import orjson
+
+    def _history_dumps(obj: List[Dict[str, Any]]) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _history_loads = orjson.loads
+except ImportError:
+    def _history_dumps(obj: List[Dict[str, Any]]) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+    _history_loads = json.loads
+
 # Global font configuration with sensible fallbacks
 mpl.rcParams['font.family'] = ['Times New Roman', 'Times', 'Liberation Serif', 'Nimbus Roman', 'DejaVu Serif', 'serif']
 mpl.rcParams['font.serif'] = ['Times New Roman', 'Times', 'Liberation Serif', 'Nimbus Roman', 'DejaVu Serif']
@@ -27,6 +57,7 @@ ARC_BASE_RADIUS_RATIO = 0.15
 ARC_F1_RADIUS_RATIO = 0.7
 ARC_F2_RADIUS_RATIO = 1.0
 ARC_FR_RADIUS_RATIO = 1.35
+ARC_SAMPLES = 24  # Points per angle arc; indistinguishable from 50 at plot resolution
 
 # Angle thresholds
 PERPENDICULAR_THRESHOLD = 5  # degrees
@@ -36,17 +67,19 @@ RIGHT_ANGLE = 90
 ZERO_THRESHOLD = 1e-6
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VectorData:
     """Data class to hold vector component information."""
     x: float
     y: float
     mag: float
     angle: float
-    
+
     def to_dict(self) -> Dict[str, float]:
         """Convert to dictionary."""
-        return asdict(self)
+        # Direct literal: asdict() goes through deepcopy machinery, which
+        # is far heavier than needed for four floats
+        return {'x': self.x, 'y': self.y, 'mag': self.mag, 'angle': self.angle}
 
 
 @dataclass
@@ -66,50 +99,59 @@ class ColorTheme:
     @staticmethod
     def light_theme() -> 'ColorTheme':
         """Default light theme."""
-        return ColorTheme(
-            name="light",
-            vector1_color="blue",
-            vector2_color="red",
-            resultant_color="black",
-            background_color="white",
-            grid_color="gray",
-            text_color="black",
-            highlight_color="yellow",
-            info_box_color="lightblue",
-            solution_box_color="white"
-        )
-    
+        return _LIGHT_THEME
+
     @staticmethod
     def dark_theme() -> 'ColorTheme':
         """Dark theme for better visibility in low light."""
-        return ColorTheme(
-            name="dark",
-            vector1_color="#00D4FF",  # Cyan
-            vector2_color="#FF6B6B",  # Coral red
-            resultant_color="#FFD93D",  # Yellow
-            background_color="#1E1E1E",
-            grid_color="#3A3A3A",
-            text_color="white",
-            highlight_color="#FF6B6B",
-            info_box_color="#2D2D2D",
-            solution_box_color="#252525"
-        )
-    
+        return _DARK_THEME
+
     @staticmethod
     def ocean_theme() -> 'ColorTheme':
         """Ocean color theme."""
-        return ColorTheme(
-            name="ocean",
-            vector1_color="#0077BE",
-            vector2_color="#00A896",
-            resultant_color="#FF6B35",
-            background_color="#F0F8FF",
-            grid_color="#B0C4DE",
-            text_color="#003366",
-            highlight_color="#FFD700",
-            info_box_color="#E0F2FF",
-            solution_box_color="#FAFAFA"
-        )
+        return _OCEAN_THEME
+
+
+# Theme singletons - themes are pure constants, so build each once at import
+# instead of allocating a fresh dataclass instance on every call.
+_LIGHT_THEME = ColorTheme(
+    name="light",
+    vector1_color="blue",
+    vector2_color="red",
+    resultant_color="black",
+    background_color="white",
+    grid_color="gray",
+    text_color="black",
+    highlight_color="yellow",
+    info_box_color="lightblue",
+    solution_box_color="white"
+)
+
+_DARK_THEME = ColorTheme(
+    name="dark",
+    vector1_color="#00D4FF",  # Cyan
+    vector2_color="#FF6B6B",  # Coral red
+    resultant_color="#FFD93D",  # Yellow
+    background_color="#1E1E1E",
+    grid_color="#3A3A3A",
+    text_color="white",
+    highlight_color="#FF6B6B",
+    info_box_color="#2D2D2D",
+    solution_box_color="#252525"
+)
+
+_OCEAN_THEME = ColorTheme(
+    name="ocean",
+    vector1_color="#0077BE",
+    vector2_color="#00A896",
+    resultant_color="#FF6B35",
+    background_color="#F0F8FF",
+    grid_color="#B0C4DE",
+    text_color="#003366",
+    highlight_color="#FFD700",
+    info_box_color="#E0F2FF",
+    solution_box_color="#FAFAFA"
+)
 
 
 class VectorHistory:
@@ -117,8 +159,10 @@ class VectorHistory:
     
     def __init__(self, max_size: int = 50):
         self.max_size = max_size
-        self.history: List[Dict[str, Any]] = []
-    
+        # Bounded deque drops the oldest entry in O(1); the old list-based
+        # trimming copied max_size references every time the cap was hit
+        self.history: Deque[Dict[str, Any]] = deque(maxlen=max_size)
+
     def add(self, f1_mag: float, f1_angle: float, f2_mag: float, f2_angle: float,
             scale: float, result: VectorData) -> None:
         """Add a calculation to history."""
@@ -132,32 +176,30 @@ class VectorHistory:
             "result": result.to_dict()
         }
         self.history.append(entry)
-        
-        # Keep only max_size entries
-        if len(self.history) > self.max_size:
-            self.history = self.history[-self.max_size:]
-    
+
     def get_all(self) -> List[Dict[str, Any]]:
         """Get all history entries."""
-        return self.history.copy()
-    
+        return list(self.history)
+
     def get_last(self, n: int = 1) -> List[Dict[str, Any]]:
-        """Get last n entries."""
-        return self.history[-n:] if self.history else []
-    
+        """Get last n entries (oldest first)."""
+        # Walk the deque from the newest end instead of copying the whole
+        # history just to slice off its tail
+        return list(islice(reversed(self.history), n))[::-1]
+
     def clear(self) -> None:
         """Clear all history."""
         self.history.clear()
-    
+
     def save_to_file(self, filepath: str) -> None:
         """Save history to JSON file."""
-        with open(filepath, 'w') as f:
-            json.dump(self.history, f, indent=2)
-    
+        with open(filepath, 'wb') as f:
+            f.write(_history_dumps(list(self.history)))
+
     def load_from_file(self, filepath: str) -> None:
         """Load history from JSON file."""
-        with open(filepath, 'r') as f:
-            self.history = json.load(f)
+        with open(filepath, 'rb') as f:
+            self.history = deque(_history_loads(f.read()), maxlen=self.max_size)
     
     def __len__(self) -> int:
         return len(self.history)
@@ -179,6 +221,95 @@ def validate_input(magnitude: float, angle: float, name: str) -> None:
         raise ValueError(f"{name} magnitude must be non-negative, got {magnitude}")
 
 
+@njit(cache=True, fastmath=True)
+def _compute_components(f1_mag: float, f1_angle: float,
+                        f2_mag: float, f2_angle: float) -> Tuple[float, ...]:
+    """Numeric core of add_vectors, kept free of Python objects so it can be JIT'd."""
+    f1_rad = math.radians(f1_angle)
+    f2_rad = math.radians(f2_angle)
+
+    f1_x = f1_mag * math.cos(f1_rad)
+    f1_y = f1_mag * math.sin(f1_rad)
+
+    f2_x = f2_mag * math.cos(f2_rad)
+    f2_y = f2_mag * math.sin(f2_rad)
+
+    r_x = f1_x + f2_x
+    r_y = f1_y + f2_y
+    r_mag = math.hypot(r_x, r_y)
+    r_angle = math.degrees(math.atan2(r_y, r_x))
+
+    return f1_x, f1_y, f2_x, f2_y, r_x, r_y, r_mag, r_angle
+
+
+@njit(cache=True, fastmath=True)
+def compute_resultant(mags: np.ndarray, angles: np.ndarray):
+    """
+    Decompose N (magnitude, angle°) pairs and sum them in one fused loop.
+
+    Args:
+        mags: Magnitudes as a float64 array
+        angles: Angles in degrees as a float64 array
+
+    Returns:
+        Tuple of (vx, vy, r_x, r_y, r_mag, r_angle) where vx/vy are the
+        per-vector component arrays and the rest describe the resultant
+    """
+    n = mags.shape[0]
+    vx = np.empty(n)
+    vy = np.empty(n)
+    r_x = 0.0
+    r_y = 0.0
+    for i in range(n):
+        rad = math.radians(angles[i])
+        vx[i] = mags[i] * math.cos(rad)
+        vy[i] = mags[i] * math.sin(rad)
+        r_x += vx[i]
+        r_y += vy[i]
+    r_mag = math.hypot(r_x, r_y)
+    r_angle = math.degrees(math.atan2(r_y, r_x))
+    return vx, vy, r_x, r_y, r_mag, r_angle
+
+
+@njit(cache=True, fastmath=True)
+def compute_view_bounds(f1x: float, f1y: float, f2x: float, f2y: float,
+                        rx: float, ry: float,
+                        padding_ratio: float, min_neg_ratio: float) -> Tuple[float, ...]:
+    """
+    Compute the axis limits that frame three vectors from the origin.
+
+    Args:
+        f1x, f1y, f2x, f2y, rx, ry: Vector components
+        padding_ratio: Fraction of the largest component used as padding
+        min_neg_ratio: Fraction reserved below/left of the origin
+
+    Returns:
+        Tuple of (max_val, x_lo, x_hi, y_lo, y_hi)
+    """
+    max_val = max(abs(f1x), abs(f1y), abs(f2x), abs(f2y), abs(rx), abs(ry))
+    x_min = min(0.0, f1x, f2x, rx)
+    x_max = max(0.0, f1x, f2x, rx)
+    y_min = min(0.0, f1y, f2y, ry)
+    y_max = max(0.0, f1y, f2y, ry)
+    padding = max_val * padding_ratio
+    min_neg = max_val * min_neg_ratio
+    return (max_val, min(x_min - padding, -min_neg), x_max + padding,
+            min(y_min - padding, -min_neg), y_max + padding)
+
+
+@njit(cache=True, fastmath=True)
+def _arc_points(angle_rad: float, radius: float, samples: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Generate arc polyline coordinates; JIT'd alongside _compute_components."""
+    theta = np.linspace(0.0, angle_rad, samples)
+    return radius * np.cos(theta), radius * np.sin(theta)
+
+
+# Degree-indexed trig tables: the angle sliders snap to whole degrees, so
+# most arcs can be sliced out of these instead of running linspace + trig
+_COS_TAB = np.cos(np.deg2rad(np.arange(361)))
+_SIN_TAB = np.sin(np.deg2rad(np.arange(361)))
+
+
 def add_vectors(f1_mag: float, f1_angle: float, f2_mag: float, f2_angle: float) -> Tuple[VectorData, VectorData, VectorData]:
     """
     Add two force vectors given magnitude and angle.
@@ -197,49 +328,71 @@ def add_vectors(f1_mag: float, f1_angle: float, f2_mag: float, f2_angle: float)
     """
     validate_input(f1_mag, f1_angle, "Force 1")
     validate_input(f2_mag, f2_angle, "Force 2")
-    
-    # Convert angles to radians
-    f1_rad = np.radians(f1_angle)
-    f2_rad = np.radians(f2_angle)
-    
-    # Calculate components
-    f1_x = f1_mag * np.cos(f1_rad)
-    f1_y = f1_mag * np.sin(f1_rad)
-    
-    f2_x = f2_mag * np.cos(f2_rad)
-    f2_y = f2_mag * np.sin(f2_rad)
-    
-    # Resultant
-    r_x = f1_x + f2_x
-    r_y = f1_y + f2_y
-    r_mag = np.sqrt(r_x**2 + r_y**2)
-    r_angle = np.degrees(np.arctan2(r_y, r_x))
-    
+
+    f1_x, f1_y, f2_x, f2_y, r_x, r_y, r_mag, r_angle = _compute_components(
+        f1_mag, f1_angle, f2_mag, f2_angle)
+
     return (VectorData(f1_x, f1_y, f1_mag, f1_angle),
             VectorData(f2_x, f2_y, f2_mag, f2_angle),
             VectorData(r_x, r_y, r_mag, r_angle))
 
+
+def add_vectors_arr(f1_mag: float, f1_angle: float,
+                    f2_mag: float, f2_angle: float) -> np.ndarray:
+    """
+    Add two force vectors, returning the results as a (3, 4) array.
+
+    Array-native companion to add_vectors for callers that feed the numbers
+    straight into numpy/matplotlib: no VectorData instances are allocated
+    and the components arrive ready for vectorized reductions.
+
+    Args:
+        f1_mag: Magnitude of force 1 (N)
+        f1_angle: Angle of force 1 (degrees, measured from positive x-axis)
+        f2_mag: Magnitude of force 2 (N)
+        f2_angle: Angle of force 2 (degrees)
+
+    Returns:
+        Array with rows (F1, F2, resultant) and columns (x, y, mag, angle)
+
+    Raises:
+        ValueError: If magnitudes are negative
+    """
+    validate_input(f1_mag, f1_angle, "Force 1")
+    validate_input(f2_mag, f2_angle, "Force 2")
+
+    f1_x, f1_y, f2_x, f2_y, r_x, r_y, r_mag, r_angle = _compute_components(
+        f1_mag, f1_angle, f2_mag, f2_angle)
+
+    return np.array([[f1_x, f1_y, f1_mag, f1_angle],
+                     [f2_x, f2_y, f2_mag, f2_angle],
+                     [r_x, r_y, r_mag, r_angle]])
+
+
 def format_measurement(value: float) -> str:
     """
     Format a measurement value by removing trailing zeros and decimal point.
-    
+
     Args:
         value: The numeric value to format
-        
+
     Returns:
         Formatted string
     """
-    return f'{value:.3f}'.rstrip('0').rstrip('.')
+    # General format strips trailing zeros in one C-level call, avoiding
+    # the f-string plus double-rstrip round trip
+    return format(value, '.4g')
 
 
 def draw_vector_with_labels(ax, origin_x: float, origin_y: float, vx: float, vy: float,
-                            color: str, label: str, mag: float, angle: float, 
+                            color: str, label: str, mag: float, angle: float,
                             cm_value: float, max_val: float, width: float = 0.003,
                             highlight: bool = False, theme: Optional[ColorTheme] = None,
-                            unit: str = 'N') -> None:
+                            unit: str = 'N',
+                            artists: Optional[Dict[str, Any]] = None) -> None:
     """
     Draw a vector arrow with measurement and label annotations.
-    
+
     Args:
         ax: Matplotlib axes object
         origin_x, origin_y: Starting point of vector
@@ -253,57 +406,130 @@ def draw_vector_with_labels(ax, origin_x: float, origin_y: float, vx: float, vy:
         width: Arrow width
         highlight: Whether to highlight with yellow background
         unit: Unit label for magnitude (e.g., 'N', 'm', 'm/s', 'm/s²')
+        artists: Optional dict of persistent artists. If populated from a
+            previous call, the quiver/text artists are updated in place via
+            set_* calls instead of being recreated (much cheaper for callers
+            that reuse one Axes across renders); if empty, the created
+            artists are stored in it for later updates.
     """
-    # Draw arrow with 2 decimal places for magnitude and angle
-    ax.quiver(origin_x, origin_y, vx, vy, angles='xy', scale_units='xy', scale=1,
-              color=color, width=width, label=f'{label} = {mag:.2f}{unit}, θ = {angle:.2f}°')
-    
+    quiver_label = f'{label} = {mag:.2f}{unit}, θ = {angle:.2f}°'
+
     # Calculate positions and offsets
     mid_x = origin_x + vx * LABEL_POSITION_RATIO
     mid_y = origin_y + vy * LABEL_POSITION_RATIO
-    perp_angle = np.radians(angle - 90)
+    perp_angle = math.radians(angle - 90)
+    # Evaluate the perpendicular direction once; both labels offset along it
+    perp_cos = math.cos(perp_angle)
+    perp_sin = math.sin(perp_angle)
     offset_dist = max_val * PERPENDICULAR_OFFSET_RATIO
-    
+
+    meas_x = mid_x + offset_dist * perp_cos
+    meas_y = mid_y + offset_dist * perp_sin
+    meas_text = f'{format_measurement(cm_value)} cm'
+
+    tip_offset = max_val * TIP_OFFSET_RATIO
+    tip_x = origin_x + vx + tip_offset * perp_cos
+    tip_y = origin_y + vy + tip_offset * perp_sin
+
+    if artists:
+        # Update the persistent artists in place
+        quiver = artists['quiver']
+        quiver.set_offsets([[origin_x, origin_y]])
+        quiver.set_UVC(vx, vy)
+        quiver.set_label(quiver_label)
+
+        measurement = artists['measurement']
+        measurement.set_position((meas_x, meas_y))
+        measurement.set_text(meas_text)
+        measurement.set_rotation(angle)
+
+        artists['tip'].set_position((tip_x, tip_y))
+        artists['tip'].set_text(label)
+        return
+
+    # Draw arrow with 2 decimal places for magnitude and angle
+    quiver = ax.quiver(origin_x, origin_y, vx, vy, angles='xy', scale_units='xy', scale=1,
+                       color=color, width=width, label=quiver_label)
+
     # Add measurement label
-    if theme is None:
-        theme = ColorTheme.ocean_theme()
-    
-    bbox_style = dict(boxstyle='round,pad=0.4', facecolor=theme.highlight_color, 
+    theme = theme or _OCEAN_THEME
+
+    bbox_style = dict(boxstyle='round,pad=0.4', facecolor=theme.highlight_color,
                      edgecolor=color, linewidth=2, alpha=0.9) if highlight else None
-    
-    ax.text(mid_x + offset_dist * np.cos(perp_angle),
-            mid_y + offset_dist * np.sin(perp_angle),
-            f'{format_measurement(cm_value)} cm',
-            fontsize=14, color=color, fontweight='bold', ha='center', va='center',
-            rotation=angle, rotation_mode='anchor', zorder=10, bbox=bbox_style)
-    
+
+    measurement = ax.text(meas_x, meas_y, meas_text,
+                          fontsize=14, color=color, fontweight='bold', ha='center', va='center',
+                          rotation=angle, rotation_mode='anchor', zorder=10, bbox=bbox_style)
+
     # Add vector label at tip
-    tip_offset = max_val * TIP_OFFSET_RATIO
-    tip_x = origin_x + vx + tip_offset * np.cos(perp_angle)
-    tip_y = origin_y + vy + tip_offset * np.sin(perp_angle)
-    
     label_bbox = dict(boxstyle='round,pad=0.3', facecolor=theme.background_color, edgecolor=color)
     if highlight:
         # Emphasize FR label with lighter styling and transparent background
         label_bbox = dict(boxstyle='round,pad=0.25', facecolor='none',
                           edgecolor=theme.resultant_color, linewidth=1.5)
-    
+
     txt = ax.text(tip_x, tip_y, label,
                   fontsize=13 if highlight else 13,
                   color=color if not highlight else 'black',
                   fontweight='bold', bbox=label_bbox, zorder=12)
-    
+
     # Add white stroke outline for readability when highlighted (subtle)
     if highlight:
         txt.set_path_effects([pe.withStroke(linewidth=2, foreground='white')])
 
+    if artists is not None:
+        artists['quiver'] = quiver
+        artists['measurement'] = measurement
+        artists['tip'] = txt
+
+
+def arc_geometry(angle: float, max_val: float,
+                 radius_ratio: float) -> Tuple[np.ndarray, np.ndarray, float, float, float]:
+    """
+    Compute the polyline and label placement for an angle arc.
 
-def draw_angle_arc(ax, angle: float, color: str, max_val: float, 
+    Args:
+        angle: Angle in degrees
+        max_val: Maximum value for radius calculation
+        radius_ratio: Ratio for arc radius
+
+    Returns:
+        Tuple of (arc_x, arc_y, label_x, label_y, label_rotation)
+    """
+    arc_radius = max_val * ARC_BASE_RADIUS_RATIO * radius_ratio
+    if float(angle).is_integer() and abs(angle) <= 360:
+        # Whole-degree fast path: slice the precomputed tables (one point per
+        # degree) and scale. cos is even, so only the sine flips sign.
+        n = int(abs(angle)) + 1
+        arc_x = arc_radius * _COS_TAB[:n]
+        arc_y = arc_radius * _SIN_TAB[:n]
+        if angle < 0:
+            arc_y = -arc_y
+    else:
+        arc_x, arc_y = _arc_points(math.radians(angle), arc_radius, ARC_SAMPLES)
+    # float32 is plenty for ~1px display precision and halves the bytes the
+    # renderer touches on every set_data
+    arc_x = arc_x.astype(np.float32, copy=False)
+    arc_y = arc_y.astype(np.float32, copy=False)
+
+    tip_angle_rad = np.radians(angle * ARC_LABEL_OFFSET_RATIO)
+    tip_radius = arc_radius * ARC_LABEL_RADIUS_RATIO
+    tip_x = tip_radius * np.cos(tip_angle_rad)
+    tip_y = tip_radius * np.sin(tip_angle_rad)
+
+    # Keep text upright - rotate 180° for downward angles
+    text_rotation = 180 if (angle < -90 or angle > 90) else 0
+
+    return arc_x, arc_y, tip_x, tip_y, text_rotation
+
+
+def draw_angle_arc(ax, angle: float, color: str, max_val: float,
                    radius_ratio: float, linewidth: float = 2,
-                   highlight: bool = False, theme: Optional[ColorTheme] = None) -> None:
+                   highlight: bool = False, theme: Optional[ColorTheme] = None,
+                   artists: Optional[Dict[str, Any]] = None) -> None:
     """
     Draw an angle arc from the positive x-axis.
-    
+
     Args:
         ax: Matplotlib axes object
         angle: Angle in degrees
@@ -312,50 +538,62 @@ def draw_angle_arc(ax, angle: float, color: str, max_val: float,
         radius_ratio: Ratio for arc radius
         linewidth: Line width for arc
         highlight: Whether to highlight with yellow background
+        artists: Optional dict of persistent artists updated in place across
+            renders (see draw_vector_with_labels)
     """
     if abs(angle) < ZERO_THRESHOLD:
+        if artists:
+            # Hide previously drawn arc instead of leaving stale data
+            artists['line'].set_data([], [])
+            artists['label'].set_text('')
+            if 'marker' in artists:
+                artists['marker'].set_data([], [])
         return
-    
-    arc_radius = max_val * ARC_BASE_RADIUS_RATIO * radius_ratio
-    theta = np.linspace(0, np.radians(angle), 50)
-    arc_x = arc_radius * np.cos(theta)
-    arc_y = arc_radius * np.sin(theta)
+
+    arc_x, arc_y, tip_x, tip_y, text_rotation = arc_geometry(angle, max_val, radius_ratio)
+
+    precision = 1 if highlight else 0
+    angle_text = f'θR = {angle:.{precision}f}°' if highlight else f'{angle:.{precision}f}°'
+
+    if artists:
+        # Update the persistent artists in place
+        artists['line'].set_data(arc_x, arc_y)
+        label = artists['label']
+        label.set_position((tip_x, tip_y))
+        label.set_text(angle_text)
+        label.set_rotation(text_rotation)
+        if 'marker' in artists:
+            artists['marker'].set_data([tip_x], [tip_y])
+        return
+
     line, = ax.plot(arc_x, arc_y, color=color, linewidth=max(linewidth, 2.5 if highlight else linewidth), zorder=6)
-    
+
     # Emphasize arc with white stroke if highlighted (subtle)
     if highlight:
         line.set_path_effects([pe.withStroke(linewidth=max(linewidth + 1.5, 3.5), foreground='white')])
-    
-    # Add label at arc tip
-    tip_angle_rad = np.radians(angle * ARC_LABEL_OFFSET_RATIO)
-    tip_radius = arc_radius * ARC_LABEL_RADIUS_RATIO
-    tip_x = tip_radius * np.cos(tip_angle_rad)
-    tip_y = tip_radius * np.sin(tip_angle_rad)
-    
-    if theme is None:
-        theme = ColorTheme.ocean_theme()
-    
-    precision = 1 if highlight else 0
-    angle_text = f'θR = {angle:.{precision}f}°' if highlight else f'{angle:.{precision}f}°'
-    
-    # Keep text upright - rotate 180° for downward angles
-    text_rotation = 0
-    if angle < -90 or angle > 90:
-        text_rotation = 180
-    
+
+    theme = theme or _OCEAN_THEME
+
     # Text styling
     text_kwargs = dict(fontsize=12 if highlight else 11,
                        color=color if not highlight else 'black',
                        fontweight='bold', ha='center', va='center',
                        rotation=text_rotation, zorder=12)
+    marker = None
     if highlight:
         text_kwargs['bbox'] = dict(boxstyle='round,pad=0.25', facecolor='none',
                                    edgecolor=color, linewidth=1.5)
         # Draw a small tip marker for emphasis
-        ax.plot(tip_x, tip_y, 'o', color=color, markersize=4, zorder=13,
-                markeredgecolor='white', markeredgewidth=1.2)
-    
-    ax.text(tip_x, tip_y, angle_text, **text_kwargs)
+        marker, = ax.plot(tip_x, tip_y, 'o', color=color, markersize=4, zorder=13,
+                          markeredgecolor='white', markeredgewidth=1.2)
+
+    label = ax.text(tip_x, tip_y, angle_text, **text_kwargs)
+
+    if artists is not None:
+        artists['line'] = line
+        artists['label'] = label
+        if marker is not None:
+            artists['marker'] = marker
 
 
 def quadrant(angle_deg: float) -> str:
@@ -393,6 +631,25 @@ def contribution_note(a: float, b: float, axis: str) -> str:
     return f'{lead} dominates {axis}'
 
 
+# Constant fragments of the solution texts, hoisted so each call reuses the
+# interned strings instead of rebuilding them.
+_DIRECT_HEADER = 'SOLUTION\n' + '=' * 50 + '\n\n'
+_ANALYTICAL_HEADER = 'ANALYTICAL SOLUTION\n' + '=' * 70 + '\n\n'
+_STEP1_INTRO = ('STEP 1: Break forces into x and y parts\n'
+                '  WHY? Angled forces are hard to add. We split them into\n'
+                '  horizontal (x) and vertical (y) parts first.\n\n')
+_STEP2_INTRO = ("STEP 2: Add all x's together, add all y's together\n"
+                '  WHY? Now that forces are split, we can add same directions.\n'
+                '  All horizontal forces combine to make total horizontal.\n'
+                '  All vertical forces combine to make total vertical.\n\n')
+_STEP3_INTRO = ('STEP 3: Find the total strength (magnitude)\n'
+                '  WHY? We have x and y parts, but need the actual force size.\n'
+                '  Use Pythagorean theorem: diagonal of a right triangle.\n\n')
+_STEP4_INTRO = ('STEP 4: Find which direction it points\n'
+                '  WHY? We know the strength, but need to know where it points.\n'
+                '  Use atan2(y,x) which gives angle from +x axis.\n')
+
+
 def generate_direct_solution(f1: VectorData, f2: VectorData, r: VectorData, scale: float, unit: str = 'N') -> str:
     """
     Generate a direct, straightforward solution without pedagogical explanation.
@@ -406,8 +663,7 @@ def generate_direct_solution(f1: VectorData, f2: VectorData, r: VectorData, scal
     Returns:
         Formatted solution text
     """
-    text = 'SOLUTION\n'
-    text += '=' * 50 + '\n\n'
+    text = _DIRECT_HEADER
     
     text += 'GIVEN:\n'
     text += f'  F₁ = {f1.mag} {unit} @ {f1.angle}°\n'
@@ -467,112 +723,103 @@ def generate_solution_text(f1: VectorData, f2: VectorData, r: VectorData,
     near_vertical = abs(r.x) < ZERO_THRESHOLD
     near_horizontal = abs(r.y) < ZERO_THRESHOLD
     
-    text = 'ANALYTICAL SOLUTION\n'
-    text += '=' * 70 + '\n\n'
+    parts = [_ANALYTICAL_HEADER]
     
-    text += 'UNDERSTANDING THE PROBLEM\n'
-    text += f'  • F₁ points to {q1}, F₂ points to {q2}\n'
-    text += f'  • Angle between them: {angle_between:.1f}° → they {relation}\n'
+    parts.append('UNDERSTANDING THE PROBLEM\n')
+    parts.append(f'  • F₁ points to {q1}, F₂ points to {q2}\n')
+    parts.append(f'  • Angle between them: {angle_between:.1f}° → they {relation}\n')
     if angle_between < 90:
-        text += f'    (< 90° means forces pull in similar directions)\n'
+        parts.append(f'    (< 90° means forces pull in similar directions)\n')
     elif abs(angle_between - 90) <= PERPENDICULAR_THRESHOLD:
-        text += f'    (≈ 90° means forces are perpendicular)\n'
+        parts.append(f'    (≈ 90° means forces are perpendicular)\n')
     else:
-        text += f'    (> 90° means forces pull in opposite directions)\n'
-    text += f'  • {x_note}; {y_note}\n\n'
-    
-    text += 'STEP 1: Break forces into x and y parts\n'
-    text += '  WHY? Angled forces are hard to add. We split them into\n'
-    text += '  horizontal (x) and vertical (y) parts first.\n\n'
-    text += f'  F₁: {f1.mag}{unit} at {f1.angle}°\n'
-    text += f'    x-part: {f1.mag}×cos({f1.angle}°) = {f1.x:.2f}{unit} (how much along +x)\n'
-    text += f'    y-part: {f1.mag}×sin({f1.angle}°) = {f1.y:.2f}{unit} (how much along +y)\n'
+        parts.append(f'    (> 90° means forces pull in opposite directions)\n')
+    parts.append(f'  • {x_note}; {y_note}\n\n')
+    
+    parts.append(_STEP1_INTRO)
+    parts.append(f'  F₁: {f1.mag}{unit} at {f1.angle}°\n')
+    parts.append(f'    x-part: {f1.mag}×cos({f1.angle}°) = {f1.x:.2f}{unit} (how much along +x)\n')
+    parts.append(f'    y-part: {f1.mag}×sin({f1.angle}°) = {f1.y:.2f}{unit} (how much along +y)\n')
     # Explain negatives for F1 components
     if f1.x < -ZERO_THRESHOLD:
-        text += f"    Note: cos({f1.angle}°) < 0 (angle in {q1}), so the x-part is negative → points to -x.\n"
+        parts.append(f"    Note: cos({f1.angle}°) < 0 (angle in {q1}), so the x-part is negative → points to -x.\n")
     elif abs(f1.x) <= ZERO_THRESHOLD:
-        text += f"    Note: cos({f1.angle}°) ≈ 0 (angle near 90° or 270°), so x ≈ 0.\n"
+        parts.append(f"    Note: cos({f1.angle}°) ≈ 0 (angle near 90° or 270°), so x ≈ 0.\n")
     if f1.y < -ZERO_THRESHOLD:
-        text += f"    Note: sin({f1.angle}°) < 0 (angle in lower half-plane), so the y-part is negative → points to -y.\n"
+        parts.append(f"    Note: sin({f1.angle}°) < 0 (angle in lower half-plane), so the y-part is negative → points to -y.\n")
     elif abs(f1.y) <= ZERO_THRESHOLD:
-        text += f"    Note: sin({f1.angle}°) ≈ 0 (angle near 0° or 180°), so y ≈ 0.\n"
-    text += "\n"
+        parts.append(f"    Note: sin({f1.angle}°) ≈ 0 (angle near 0° or 180°), so y ≈ 0.\n")
+    parts.append("\n")
     
-    text += f'  F₂: {f2.mag}{unit} at {f2.angle}°\n'
-    text += f'    x-part: {f2.mag}×cos({f2.angle}°) = {f2.x:.2f}{unit}\n'
-    text += f'    y-part: {f2.mag}×sin({f2.angle}°) = {f2.y:.2f}{unit}\n'
+    parts.append(f'  F₂: {f2.mag}{unit} at {f2.angle}°\n')
+    parts.append(f'    x-part: {f2.mag}×cos({f2.angle}°) = {f2.x:.2f}{unit}\n')
+    parts.append(f'    y-part: {f2.mag}×sin({f2.angle}°) = {f2.y:.2f}{unit}\n')
     # Explain negatives for F2 components
     if f2.x < -ZERO_THRESHOLD:
-        text += f"    Note: cos({f2.angle}°) < 0 (angle in {q2}), so the x-part is negative → points to -x.\n"
+        parts.append(f"    Note: cos({f2.angle}°) < 0 (angle in {q2}), so the x-part is negative → points to -x.\n")
     elif abs(f2.x) <= ZERO_THRESHOLD:
-        text += f"    Note: cos({f2.angle}°) ≈ 0 (angle near 90° or 270°), so x ≈ 0.\n"
+        parts.append(f"    Note: cos({f2.angle}°) ≈ 0 (angle near 90° or 270°), so x ≈ 0.\n")
     if f2.y < -ZERO_THRESHOLD:
-        text += f"    Note: sin({f2.angle}°) < 0 (angle in lower half-plane), so the y-part is negative → points to -y.\n"
+        parts.append(f"    Note: sin({f2.angle}°) < 0 (angle in lower half-plane), so the y-part is negative → points to -y.\n")
     elif abs(f2.y) <= ZERO_THRESHOLD:
-        text += f"    Note: sin({f2.angle}°) ≈ 0 (angle near 0° or 180°), so y ≈ 0.\n"
-    text += "\n"
-    
-    text += 'STEP 2: Add all x\'s together, add all y\'s together\n'
-    text += '  WHY? Now that forces are split, we can add same directions.\n'
-    text += '  All horizontal forces combine to make total horizontal.\n'
-    text += '  All vertical forces combine to make total vertical.\n\n'
-    text += f'  Total x: {f1.x:.2f} + {f2.x:.2f} = {r.x:.2f}{unit}\n'
+        parts.append(f"    Note: sin({f2.angle}°) ≈ 0 (angle near 0° or 180°), so y ≈ 0.\n")
+    parts.append("\n")
+    
+    parts.append(_STEP2_INTRO)
+    parts.append(f'  Total x: {f1.x:.2f} + {f2.x:.2f} = {r.x:.2f}{unit}\n')
     if r.x > 0:
-        text += f'           (positive = net push to the right)\n'
+        parts.append(f'           (positive = net push to the right)\n')
     elif r.x < 0:
         # Explain why negative total x
         pos_x = []
         neg_x = []
         pos_x.append(f"F₁ₓ={f1.x:.2f}") if f1.x > 0 else neg_x.append(f"F₁ₓ={f1.x:.2f}") if f1.x < 0 else None
         pos_x.append(f"F₂ₓ={f2.x:.2f}") if f2.x > 0 else neg_x.append(f"F₂ₓ={f2.x:.2f}") if f2.x < 0 else None
-        text += f'           (negative = net push to the left)\n'
-        text += f"           because negatives ({', '.join(neg_x) if neg_x else 'none'}) outweigh positives ({', '.join(pos_x) if pos_x else 'none'}).\n"
-    text += f'  Total y: {f1.y:.2f} + {f2.y:.2f} = {r.y:.2f}{unit}\n'
+        parts.append(f'           (negative = net push to the left)\n')
+        parts.append(f"           because negatives ({', '.join(neg_x) if neg_x else 'none'}) outweigh positives ({', '.join(pos_x) if pos_x else 'none'}).\n")
+    parts.append(f'  Total y: {f1.y:.2f} + {f2.y:.2f} = {r.y:.2f}{unit}\n')
     if r.y > 0:
-        text += f'           (positive = net push upward)\n'
+        parts.append(f'           (positive = net push upward)\n')
     elif r.y < 0:
         # Explain why negative total y
         pos_y = []
         neg_y = []
         pos_y.append(f"F₁ᵧ={f1.y:.2f}") if f1.y > 0 else neg_y.append(f"F₁ᵧ={f1.y:.2f}") if f1.y < 0 else None
         pos_y.append(f"F₂ᵧ={f2.y:.2f}") if f2.y > 0 else neg_y.append(f"F₂ᵧ={f2.y:.2f}") if f2.y < 0 else None
-        text += f'           (negative = net push downward)\n'
-        text += f"           because negatives ({', '.join(neg_y) if neg_y else 'none'}) outweigh positives ({', '.join(pos_y) if pos_y else 'none'}).\n"
-    text += '\n'
-    
-    text += 'STEP 3: Find the total strength (magnitude)\n'
-    text += '  WHY? We have x and y parts, but need the actual force size.\n'
-    text += '  Use Pythagorean theorem: diagonal of a right triangle.\n\n'
-    text += f'  |FR| = √(x² + y²) = √({r.x:.2f}² + {r.y:.2f}²)\n'
-    text += f'       = {r.mag:.2f}{unit}\n\n'
-    
-    text += 'STEP 4: Find which direction it points\n'
-    text += '  WHY? We know the strength, but need to know where it points.\n'
-    text += '  Use atan2(y,x) which gives angle from +x axis.\n'
+        parts.append(f'           (negative = net push downward)\n')
+        parts.append(f"           because negatives ({', '.join(neg_y) if neg_y else 'none'}) outweigh positives ({', '.join(pos_y) if pos_y else 'none'}).\n")
+    parts.append('\n')
+    
+    parts.append(_STEP3_INTRO)
+    parts.append(f'  |FR| = √(x² + y²) = √({r.x:.2f}² + {r.y:.2f}²)\n')
+    parts.append(f'       = {r.mag:.2f}{unit}\n\n')
+    
+    parts.append(_STEP4_INTRO)
     if near_vertical:
-        text += '  NOTE: x≈0, so force is nearly vertical (90° or 270°)\n'
+        parts.append('  NOTE: x≈0, so force is nearly vertical (90° or 270°)\n')
     elif near_horizontal:
-        text += '  NOTE: y≈0, so force is nearly horizontal (0° or 180°)\n'
-    text += f'\n  θ = atan2({r.y:.2f}, {r.x:.2f}) = {r.angle:.2f}°\n'
+        parts.append('  NOTE: y≈0, so force is nearly horizontal (0° or 180°)\n')
+    parts.append(f'\n  θ = atan2({r.y:.2f}, {r.x:.2f}) = {r.angle:.2f}°\n')
     if r.angle < 0:
-        text += '  Note: negative angle = clockwise from +x, happens because FRᵧ < 0 (below x-axis).\n'
-    text += f'  Result: FR points to {qr}\n'
+        parts.append('  Note: negative angle = clockwise from +x, happens because FRᵧ < 0 (below x-axis).\n')
+    parts.append(f'  Result: FR points to {qr}\n')
     if 0 <= r.angle < 90:
-        text += '         (up and to the right)\n'
+        parts.append('         (up and to the right)\n')
     elif 90 <= r.angle < 180:
-        text += '         (up and to the left)\n'
+        parts.append('         (up and to the left)\n')
     elif -180 <= r.angle < -90:
-        text += '         (down and to the left)\n'
+        parts.append('         (down and to the left)\n')
     else:
-        text += '         (down and to the right)\n'
+        parts.append('         (down and to the right)\n')
     
-    return text
+    return ''.join(parts)
 
 
-def plot_vectors(f1_mag: float, f1_angle: float, f2_mag: float, f2_angle: float, 
+def plot_vectors(f1_mag: float, f1_angle: float, f2_mag: float, f2_angle: float,
                 scale: float = 10, theme: Optional[ColorTheme] = None,
                 save_path: Optional[str] = None, save_format: str = 'png',
-                history: Optional[VectorHistory] = None) -> None:
+                history: Optional[VectorHistory] = None,
+                show_solution: bool = True) -> None:
     """
     Plot the two force vectors and their resultant with detailed annotations.
     
@@ -586,16 +833,22 @@ def plot_vectors(f1_mag: float, f1_angle: float, f2_mag: float, f2_angle: float,
         save_path: Path to save the plot (if None, displays interactively)
         save_format: Format for saving ('png', 'svg', 'pdf')
         history: VectorHistory object to track calculations
+        show_solution: Whether to render the analytical solution panel;
+            skipping it avoids both the text generation and matplotlib's
+            costly layout of the large monospaced text block
     """
+    # pyplot (and with it backend selection) is only needed here; importing
+    # it lazily keeps the web apps' import of this module lightweight
+    import matplotlib.pyplot as plt
+
     f1, f2, r = add_vectors(f1_mag, f1_angle, f2_mag, f2_angle)
-    
+
     # Add to history if provided
     if history is not None:
         history.add(f1_mag, f1_angle, f2_mag, f2_angle, scale, r)
     
     # Use default theme if not provided
-    if theme is None:
-        theme = ColorTheme.ocean_theme()
+    theme = theme or _OCEAN_THEME
     
     # Convert to cm based on scale
     f1_cm = f1.mag / scale
@@ -603,10 +856,11 @@ def plot_vectors(f1_mag: float, f1_angle: float, f2_mag: float, f2_angle: float,
     r_cm = r.mag / scale
     
     fig, ax = plt.subplots(figsize=(20, 10), facecolor=theme.background_color)
-    ax.set_facecolor(theme.background_color)
-    
-    # Calculate max value for scaling (needed for offsets)
-    max_val = max(abs(f1.x), abs(f1.y), abs(f2.x), abs(f2.y), abs(r.x), abs(r.y))
+
+    # Calculate max value for scaling (needed for offsets) with one
+    # vectorized reduction over the component matrix (rows F1/F2/R)
+    coords = np.array([[f1.x, f1.y], [f2.x, f2.y], [r.x, r.y]])
+    max_val = np.abs(coords).max()
     
     # Draw vectors with labels
     draw_vector_with_labels(ax, 0, 0, f1.x, f1.y, theme.vector1_color, 'F₁', f1.mag, f1.angle, 
@@ -629,18 +883,17 @@ def plot_vectors(f1_mag: float, f1_angle: float, f2_mag: float, f2_angle: float,
                   linewidth=2.5, highlight=True, theme=theme)
     
     # Set equal aspect ratio and grid
-    x_vals = [0, f1.x, f2.x, r.x]
-    y_vals = [0, f1.y, f2.y, r.y]
-    x_min, x_max = min(x_vals), max(x_vals)
-    y_min, y_max = min(y_vals), max(y_vals)
+    x_min, y_min = np.minimum(coords.min(axis=0), 0.0)
+    x_max, y_max = np.maximum(coords.max(axis=0), 0.0)
     
     # Add padding and ensure some negative space is visible
     padding = max_val * PADDING_RATIO
     min_neg_space = max_val * MIN_NEGATIVE_SPACE_RATIO
     
-    ax.set_xlim(min(x_min - padding, -min_neg_space), x_max + padding)
-    ax.set_ylim(min(y_min - padding, -min_neg_space), y_max + padding)
-    ax.set_aspect('equal')
+    # One batched property call invalidates the Axes once instead of per setter
+    ax.set(xlim=(min(x_min - padding, -min_neg_space), x_max + padding),
+           ylim=(min(y_min - padding, -min_neg_space), y_max + padding),
+           aspect='equal', facecolor=theme.background_color)
     ax.grid(True, alpha=0.3, color=theme.grid_color)
     ax.axhline(y=0, color=theme.grid_color, linewidth=0.5)
     ax.axvline(x=0, color=theme.grid_color, linewidth=0.5)
@@ -673,15 +926,19 @@ def plot_vectors(f1_mag: float, f1_angle: float, f2_mag: float, f2_angle: float,
                      edgecolor=theme.text_color, linewidth=2, alpha=0.9))
     
     # Add analytical solution text
-    solution_text = generate_solution_text(f1, f2, r, scale)
-    ax.text(1.03, 0.5, solution_text, transform=ax.transAxes,
-            fontsize=13, verticalalignment='center', horizontalalignment='left',
-            family='monospace', color=theme.text_color,
-            bbox=dict(boxstyle='round,pad=0.8', facecolor=theme.solution_box_color, 
-                     edgecolor=theme.text_color, linewidth=2))
-    
-    plt.tight_layout()
-    
+    if show_solution:
+        solution_text = generate_solution_text(f1, f2, r, scale)
+        ax.text(1.03, 0.5, solution_text, transform=ax.transAxes,
+                fontsize=13, verticalalignment='center', horizontalalignment='left',
+                family='monospace', color=theme.text_color,
+                bbox=dict(boxstyle='round,pad=0.8', facecolor=theme.solution_box_color,
+                         edgecolor=theme.text_color, linewidth=2))
+    
+    # Fixed margins instead of the tight_layout constraint solve; the
+    # side panels are placed in axes coordinates and saving already crops
+    # with bbox_inches='tight'
+    fig.subplots_adjust(left=0.05, right=0.95, top=0.95, bottom=0.08)
+
     # Save or show
     if save_path:
         plt.savefig(save_path, format=save_format, dpi=300, bbox_inches='tight',
@@ -4,18 +4,25 @@ Modern Vector Addition Calculator GUI
 Inspired by modern dashboard design with clean, card-based interface
 """
 
+import pickle
+import time
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import matplotlib
 matplotlib.use('TkAgg')
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.collections import LineCollection
 from matplotlib.figure import Figure
 import numpy as np
 from datetime import datetime
 
 from vector_addition import (
     add_vectors, plot_vectors, ColorTheme, VectorHistory,
-    VectorData, format_measurement
+    VectorData, format_measurement, generate_solution_text,
+    draw_vector_with_labels, draw_angle_arc, compute_view_bounds,
+    PADDING_RATIO, MIN_NEGATIVE_SPACE_RATIO,
+    ARC_F1_RADIUS_RATIO, ARC_F2_RADIUS_RATIO, ARC_FR_RADIUS_RATIO
 )
 
 
@@ -61,13 +68,51 @@ class ModernVectorGUI:
         self.solution_visible = False
         
         # Animation variables
-        self.animation_progress = 0
         self.animation_running = False
         self.animation_id = None
         self.stored_vectors = None
         self.animation_enabled = True
         self.animation_speed = 0.04  # Default speed
-        
+
+        # Blitting state: the static scene (grid, labels, legend) is drawn
+        # once per Calculate and kept as a raster background; only the
+        # animated artists are redrawn per frame on top of it
+        self._bg = None
+        self._bg_size = None
+        self._anim_ax = None
+        self._anim_max_val = 0.0
+        self._vec_artists = []
+        self._arc_artists = []
+        self._construction = None
+        # Bumped by every start_animation; stale in-flight ticks compare
+        # against it and drop out instead of drawing superseded vectors
+        self._anim_seq = 0
+        
+        # Pending debounced validation callbacks, keyed by field name.
+        # _loading_history mutes the entry/slider callbacks while
+        # load_from_history writes known-good values programmatically
+        self._pending_validations = {}
+        self._loading_history = False
+
+        # Constructed ColorTheme instances, keyed by combobox name, plus
+        # the active name so spurious combobox events skip the redraw
+        self._theme_cache = {'ocean': self.current_theme}
+        self._current_theme_name = 'ocean'
+
+        # Pending after-handle for the inline-error clear timer
+        self._err_reset_id = None
+
+        # Last values shown in the result/solution panels; repeated
+        # Calculate clicks with unchanged inputs skip the widget updates
+        self._last_result_key = None
+        self._last_solution = None
+
+        # Single worker for plot exports so the 300 dpi savefig does not
+        # block the Tk mainloop
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        # Last accepted slider update per field, for drag throttling
+        self._last_slider_update = {}
+
         # History navigation
         self.history_index = -1
         
@@ -197,14 +242,41 @@ class ModernVectorGUI:
         self.create_input_field(f2_card, "Angle (°):", "120", 'f2_angle')
         self.f2_slider = self.create_slider(f2_card, 'f2_angle')
         
-        # Result card
+        # Result card. StringVar-bound labels instead of a tk.Text widget:
+        # the layout is fixed, so updates are five O(1) StringVar sets and a
+        # label repaint rather than a full text delete/re-insert
         result_card = self.create_card(parent, "Resultant (FR)", color='#28A745')
-        self.result_text = tk.Text(result_card, height=6, width=25,
-                                   font=('Segoe UI', 9),
-                                   bg='#F8F9FA', fg=self.COLORS['text_dark'],
-                                   relief='flat', padx=10, pady=10)
-        self.result_text.pack(fill=tk.BOTH, expand=True, padx=15, pady=(0, 15))
-        self.result_text.config(state=tk.DISABLED)
+        self._result_frame = tk.Frame(result_card, bg='#F8F9FA', padx=10, pady=10)
+        self._result_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=(0, 15))
+        self._res_mag = tk.StringVar(value='--')
+        self._res_len = tk.StringVar(value='--')
+        self._res_ang = tk.StringVar(value='--')
+        self._res_x = tk.StringVar(value='--')
+        self._res_y = tk.StringVar(value='--')
+        self._result_labels = []
+        for row, (caption, var) in enumerate((('Magnitude:', self._res_mag),
+                                              ('Length:', self._res_len),
+                                              ('Angle:', self._res_ang),
+                                              ('Component X:', self._res_x),
+                                              ('Component Y:', self._res_y))):
+            name = tk.Label(self._result_frame, text=caption,
+                            font=('Segoe UI', 9), bg='#F8F9FA',
+                            fg=self.COLORS['text_dark'], anchor='w')
+            name.grid(row=row, column=0, sticky='w', pady=1)
+            value = tk.Label(self._result_frame, textvariable=var,
+                             font=('Segoe UI', 9, 'bold'), bg='#F8F9FA',
+                             fg=self.COLORS['text_dark'], anchor='e')
+            value.grid(row=row, column=1, sticky='e', pady=1)
+            self._result_labels.extend((name, value))
+        self._result_frame.columnconfigure(1, weight=1)
+        # Inline error line, blank until a validation error occurs
+        self._error_var = tk.StringVar(value='')
+        self._error_label = tk.Label(self._result_frame, textvariable=self._error_var,
+                                     font=('Segoe UI', 9), bg='#F8F9FA',
+                                     fg=self.COLORS['danger'], anchor='w',
+                                     justify=tk.LEFT, wraplength=180)
+        self._error_label.grid(row=5, column=0, columnspan=2, sticky='w', pady=(4, 0))
+        self._result_labels.append(self._error_label)
         
         # Action buttons
         btn_frame = tk.Frame(parent, bg=self.COLORS['bg'])
@@ -322,8 +394,8 @@ class ModernVectorGUI:
         error_label.pack(anchor=tk.W)
         setattr(self, f'{var_name}_error', error_label)
         
-        # Bind validation
-        var.trace_add('write', lambda *args: self.validate_input(var_name))
+        # Bind validation (debounced, so fast typing costs one check)
+        var.trace_add('write', lambda *args: self._schedule_validate(var_name))
         
         return var
     
@@ -333,8 +405,12 @@ class ModernVectorGUI:
         frame.pack(fill=tk.X, padx=15, pady=(0, 15))
         
         slider = ttk.Scale(frame, from_=0, to=360, orient=tk.HORIZONTAL,
-                          command=lambda v: self.update_angle_from_slider(var_name, v))
+                          command=lambda v: self._throttled_slider_update(var_name, v))
         slider.pack(fill=tk.X)
+        # The throttle may swallow the last few drag events; deliver the
+        # final position on release so it is never dropped
+        slider.bind('<ButtonRelease-1>',
+                    lambda e: self.update_angle_from_slider(var_name, slider.get()))
         
         # Set initial value
         initial = float(getattr(self, f'{var_name}_var').get())
@@ -389,6 +465,10 @@ class ModernVectorGUI:
         self.figure = Figure(figsize=(12, 8), dpi=100,
                             facecolor=self.current_theme.background_color)
         self.figure.subplots_adjust(left=0.05, right=0.95, top=0.95, bottom=0.08)
+        # One Axes reused for every render: ax.clear() resets the artists
+        # without tearing down and reallocating spines, ticks, and
+        # transforms the way figure.clear() + add_subplot did
+        self.ax = self.figure.add_subplot(111, facecolor=self.current_theme.background_color)
         
         self.canvas = FigureCanvasTkAgg(self.figure, plot_card)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=15, pady=15)
@@ -458,6 +538,28 @@ class ModernVectorGUI:
         except Exception:
             pass
     
+    def _schedule_validate(self, var_name):
+        """Debounce validation: collapse a burst of keystrokes into one check.
+
+        Each write to the entry cancels the previously scheduled validation
+        and re-arms a short timer, so the float parse and error-label update
+        run once after typing pauses instead of per keystroke.
+        """
+        if self._loading_history:
+            # Programmatic sets of already-validated history values; skip
+            # the five validation passes they would otherwise queue
+            return
+        pending = self._pending_validations.pop(var_name, None)
+        if pending is not None:
+            self.root.after_cancel(pending)
+        self._pending_validations[var_name] = self.root.after(
+            120, lambda: self._run_validation(var_name))
+
+    def _run_validation(self, var_name):
+        """Run a debounced validation and clear its pending handle."""
+        self._pending_validations.pop(var_name, None)
+        self.validate_input(var_name)
+
     def validate_input(self, var_name):
         """Validate input field in real-time."""
         var = getattr(self, f'{var_name}_var')
@@ -480,6 +582,23 @@ class ModernVectorGUI:
         except ValueError:
             error_label.config(text="⚠ Invalid number")
     
+    def _throttled_slider_update(self, var_name, value):
+        """Forward slider motion to the entry at most ~30 times a second.
+
+        ttk.Scale fires its command once per pixel of travel during a drag;
+        writing the StringVar that often just queues redundant validation
+        and redraw work between frames.
+        """
+        if self._loading_history:
+            # load_from_history already wrote the exact angle text; the
+            # slider.set echo would round-trip it through the formatter
+            return
+        now = time.perf_counter()
+        if now - self._last_slider_update.get(var_name, 0.0) < 0.033:
+            return
+        self._last_slider_update[var_name] = now
+        self.update_angle_from_slider(var_name, value)
+
     def update_angle_from_slider(self, var_name, value):
         """Update angle entry from slider."""
         var = getattr(self, f'{var_name}_var')
@@ -504,7 +623,9 @@ class ModernVectorGUI:
                 self.history_index = len(self.history.history) - 1
             else:
                 # If we're not at the end, truncate future history
-                self.history.history = self.history.history[:self.history_index + 1]
+                # (pop from the right; the deque backing has no slicing)
+                while len(self.history.history) > self.history_index + 1:
+                    self.history.history.pop()
                 self.history.add(f1_mag, f1_angle, f2_mag, f2_angle, scale, r)
                 self.history_index = len(self.history.history) - 1
             
@@ -526,17 +647,13 @@ class ModernVectorGUI:
         """Draw vectors on axes with optional animation progress."""
         if arc_progress is None:
             arc_progress = progress
-        from vector_addition import (
-            draw_vector_with_labels, draw_angle_arc,
-            PADDING_RATIO, MIN_NEGATIVE_SPACE_RATIO,
-            ARC_F1_RADIUS_RATIO, ARC_F2_RADIUS_RATIO, ARC_FR_RADIUS_RATIO
-        )
-        
         f1_cm = f1.mag / scale
         f2_cm = f2.mag / scale
         r_cm = r.mag / scale
         
-        max_val = max(abs(f1.x), abs(f1.y), abs(f2.x), abs(f2.y), abs(r.x), abs(r.y))
+        max_val, x_lo, x_hi, y_lo, y_hi = compute_view_bounds(
+            f1.x, f1.y, f2.x, f2.y, r.x, r.y,
+            PADDING_RATIO, MIN_NEGATIVE_SPACE_RATIO)
         
         # Draw vectors with animation progress
         draw_vector_with_labels(ax, 0, 0, f1.x * progress, f1.y * progress, '#5B8DEE', 'F₁',
@@ -547,33 +664,30 @@ class ModernVectorGUI:
                                r.mag, r.angle, r_cm, max_val, width=0.004,
                                highlight=True, theme=self.current_theme)
         
-        # Construction lines (only show when animation complete - consistent threshold)
+        # Construction lines (only show when animation complete - consistent
+        # threshold); both dashed segments share one collection so they
+        # rasterize in a single draw call
         if progress >= 1.0:
-            ax.plot([f1.x, f1.x + f2.x], [f1.y, f1.y + f2.y],
-                    color='#FF6B6B', linestyle='--', linewidth=1.5, alpha=0.4)
-            ax.plot([f2.x, f2.x + f1.x], [f2.y, f2.y + f1.y],
-                    color='#5B8DEE', linestyle='--', linewidth=1.5, alpha=0.4)
+            ax.add_collection(LineCollection(
+                [[(f1.x, f1.y), (f1.x + f2.x, f1.y + f2.y)],
+                 [(f2.x, f2.y), (f2.x + f1.x, f2.y + f1.y)]],
+                colors=('#FF6B6B', '#5B8DEE'), linestyles='--',
+                linewidths=1.5, alpha=0.4))
         
         # Angle arcs (only show after arrows complete, with gradual growth)
         if arc_progress >= 1.0:
-            # Calculate arc angle progress (grows after arrows are complete)
-            arc_angle_progress = min(1.0, (arc_progress - 1.0) * 3)  # Grows 3x faster than arrows
+            # Calculate arc angle progress (grows after arrows are complete).
+            # arc_progress runs 1.0 -> 1.33, so normalize by the 0.33 span so
+            # the sweep reaches exactly 1.0 and the labels show true angles
+            arc_angle_progress = min(1.0, (arc_progress - 1.0) / 0.33)
             draw_angle_arc(ax, f1.angle * arc_angle_progress, '#5B8DEE', max_val, ARC_F1_RADIUS_RATIO, theme=self.current_theme)
             draw_angle_arc(ax, f2.angle * arc_angle_progress, '#FF6B6B', max_val, ARC_F2_RADIUS_RATIO, theme=self.current_theme)
             draw_angle_arc(ax, r.angle * arc_angle_progress, '#28A745', max_val, ARC_FR_RADIUS_RATIO,
                           linewidth=2.5, highlight=True, theme=self.current_theme)
         
         # Styling
-        x_vals = [0, f1.x, f2.x, r.x]
-        y_vals = [0, f1.y, f2.y, r.y]
-        x_min, x_max = min(x_vals), max(x_vals)
-        y_min, y_max = min(y_vals), max(y_vals)
-        
-        padding = max_val * PADDING_RATIO
-        min_neg_space = max_val * MIN_NEGATIVE_SPACE_RATIO
-        
-        ax.set_xlim(min(x_min - padding, -min_neg_space), x_max + padding)
-        ax.set_ylim(min(y_min - padding, -min_neg_space), y_max + padding)
+        ax.set_xlim(x_lo, x_hi)
+        ax.set_ylim(y_lo, y_hi)
         ax.set_aspect('equal')
         ax.set_facecolor(self.current_theme.background_color)
         ax.grid(True, alpha=0.3, color=self.current_theme.grid_color, linestyle='-', linewidth=0.5)
@@ -589,90 +703,240 @@ class ModernVectorGUI:
         legend = ax.legend(loc='upper right', fontsize=10, framealpha=0.95,
                           edgecolor=self.current_theme.text_color)
     
+    def _setup_animation_scene(self, f1, f2, r, scale):
+        """Build the axes and persistent artists for one animation run.
+
+        The static chrome (grid, axis lines, labels, title, legend, view
+        limits) is drawn once and rasterized as the blit background; the
+        arrows, construction lines, and arcs are created as animated
+        artists that animate_step mutates in place and redraws on top.
+        """
+        ax = self.ax
+        ax.clear()
+        self.figure.set_facecolor(self.current_theme.background_color)
+        ax.set_facecolor(self.current_theme.background_color)
+
+        # View limits are frame-invariant, so fix them up front
+        max_val, x_lo, x_hi, y_lo, y_hi = compute_view_bounds(
+            f1.x, f1.y, f2.x, f2.y, r.x, r.y,
+            PADDING_RATIO, MIN_NEGATIVE_SPACE_RATIO)
+        ax.set_xlim(x_lo, x_hi)
+        ax.set_ylim(y_lo, y_hi)
+        ax.set_aspect('equal')
+        ax.grid(True, alpha=0.3, color=self.current_theme.grid_color, linestyle='-', linewidth=0.5)
+        ax.axhline(y=0, color=self.current_theme.grid_color, linewidth=1.5, zorder=2)
+        ax.axvline(x=0, color=self.current_theme.grid_color, linewidth=1.5, zorder=2)
+        ax.set_xlabel('Fₓ (N)', fontsize=11, color=self.current_theme.text_color, fontweight='600')
+        ax.set_ylabel('Fᵧ (N)', fontsize=11, color=self.current_theme.text_color, fontweight='600')
+        ax.set_title('Vector Addition Visualization', fontsize=13, fontweight='bold',
+                    color=self.current_theme.text_color, pad=15)
+        ax.tick_params(colors=self.current_theme.text_color)
+
+        # Persistent vector artists, created at final geometry so the legend
+        # entries and label texts are correct from the first frame
+        self._vec_artists = []
+        for vec, color, name, width, highlight in (
+                (f1, '#5B8DEE', 'F₁', 0.003, False),
+                (f2, '#FF6B6B', 'F₂', 0.003, False),
+                (r, '#28A745', 'FR', 0.004, True)):
+            handles = {}
+            draw_vector_with_labels(ax, 0, 0, vec.x, vec.y, color, name,
+                                   vec.mag, vec.angle, vec.mag / scale, max_val,
+                                   width=width, highlight=highlight,
+                                   theme=self.current_theme, artists=handles)
+            self._vec_artists.append((vec, color, name, width, highlight, handles))
+
+        # Legend laid out once, against the final artist labels; it stays in
+        # the background, untouched by the per-frame path
+        ax.legend(loc='upper right', fontsize=10, framealpha=0.95,
+                  edgecolor=self.current_theme.text_color)
+
+        # Construction lines start hidden; segments are filled in once the
+        # arrows complete. One two-segment LineCollection draws both dashed
+        # lines in a single Agg call
+        self._construction = LineCollection(
+            [], colors=('#FF6B6B', '#5B8DEE'), linestyles='--',
+            linewidths=1.5, alpha=0.4)
+        ax.add_collection(self._construction)
+
+        # Arc artists: create at the final angle (so line/label/marker slots
+        # exist), then blank them until the arc phase of the animation
+        self._arc_artists = []
+        for angle, color, ratio, linewidth, highlight in (
+                (f1.angle, '#5B8DEE', ARC_F1_RADIUS_RATIO, 2, False),
+                (f2.angle, '#FF6B6B', ARC_F2_RADIUS_RATIO, 2, False),
+                (r.angle, '#28A745', ARC_FR_RADIUS_RATIO, 2.5, True)):
+            handles = {}
+            draw_angle_arc(ax, angle, color, max_val, ratio, linewidth=linewidth,
+                          highlight=highlight, theme=self.current_theme, artists=handles)
+            if handles:
+                draw_angle_arc(ax, 0.0, color, max_val, ratio, artists=handles)
+            self._arc_artists.append((angle, color, ratio, highlight, handles))
+
+        # Animated artists are excluded from canvas.draw(), which leaves the
+        # clean background to capture
+        for artist in self._iter_dynamic_artists():
+            artist.set_animated(True)
+        self.canvas.draw()
+        self._bg = self.canvas.copy_from_bbox(ax.bbox)
+        self._bg_size = self.canvas.get_width_height()
+        self._anim_ax = ax
+        self._anim_max_val = max_val
+
+    def _iter_dynamic_artists(self):
+        """Yield every artist the animation mutates, in draw order."""
+        for _, _, _, _, _, handles in self._vec_artists:
+            yield from handles.values()
+        yield self._construction
+        for _, _, _, _, handles in self._arc_artists:
+            yield from handles.values()
+
     def start_animation(self):
         """Start the arrow animation."""
-        if not self.animation_enabled:
-            # Skip animation, draw final state
-            if self.stored_vectors:
-                f1, f2, r, scale = self.stored_vectors
-                self.figure.clear()
-                self.figure.set_facecolor(self.current_theme.background_color)
-                ax = self.figure.add_subplot(111, facecolor=self.current_theme.background_color)
-                self.draw_vectors_on_ax(ax, f1, f2, r, scale, progress=1.0, arc_progress=1.33)
-                self.canvas.draw()
+        if not self.stored_vectors:
             return
-        
+        self._anim_seq += 1
         if self.animation_running and self.animation_id:
             self.root.after_cancel(self.animation_id)
-        
-        self.animation_progress = 0
+            self.animation_id = None
+
+        f1, f2, r, scale = self.stored_vectors
+        if not self.animation_enabled:
+            # Skip animation, draw final state
+            self._bg = None
+            self.ax.clear()
+            self.figure.set_facecolor(self.current_theme.background_color)
+            self.ax.set_facecolor(self.current_theme.background_color)
+            self.draw_vectors_on_ax(self.ax, f1, f2, r, scale, progress=1.0, arc_progress=1.33)
+            # Coalesce with whatever else this event cycle queued; nothing
+            # reads the rasterization synchronously on this path
+            self.canvas.draw_idle()
+            return
+
+        self._setup_animation_scene(f1, f2, r, scale)
+
+        # All easing math for the whole run in one vectorized pass; the tick
+        # callback is left indexing the tables. Frame i sits at progress
+        # i * speed, the same schedule the incremental loop produced.
+        t = np.arange(int(np.ceil(1.33 / self.animation_speed))) * self.animation_speed
+        self._arrow_frames = 1.0 - (1.0 - np.minimum(t, 1.0)) ** 3
+        arc_t = np.minimum(np.maximum((t - 1.0) / 0.33, 0.0), 1.0)
+        self._arc_frames = np.where(t >= 1.0,
+                                    1.0 + (1.0 - (1.0 - arc_t) ** 3) * 0.33,
+                                    self._arrow_frames)
+        self._frame_idx = 0
         self.animation_running = True
         self.animate_step()
-    
-    def animate_step(self):
-        """Perform one step of the animation."""
-        if not self.stored_vectors:
+
+    def animate_step(self, seq=None):
+        """Perform one step of the animation (blitted)."""
+        if seq is None:
+            seq = self._anim_seq
+        elif seq != self._anim_seq:
+            # A newer Calculate replaced this run; its own chain is already
+            # drawing the fresh scene
+            return
+        if not self.stored_vectors or self._bg is None:
             self.animation_running = False
             return
-        
-        # Ease-out cubic easing for smoother animation
-        t = min(1.0, self.animation_progress)
-        arrow_progress = 1 - pow(1 - t, 3)
-        
-        # Calculate arc progress (starts after arrows complete)
-        arc_progress = 0
-        if self.animation_progress >= 1.0:
-            arc_t = min(1.0, (self.animation_progress - 1.0) / 0.33)  # Arc animation duration
-            arc_progress = 1.0 + (1 - pow(1 - arc_t, 3)) * 0.33  # Ease-out for arcs
-        else:
-            arc_progress = arrow_progress
-        
+
+        # Eased arrow/arc progress comes straight out of the precomputed
+        # frame tables - no per-tick easing math on the UI thread
+        i = self._frame_idx
+        arrow_progress = self._arrow_frames[i]
+        arc_progress = self._arc_frames[i]
+
         f1, f2, r, scale = self.stored_vectors
-        
-        # Clear and redraw with current progress
-        self.figure.clear()
-        self.figure.set_facecolor(self.current_theme.background_color)
-        ax = self.figure.add_subplot(111, facecolor=self.current_theme.background_color)
-        # Use arrow_progress capped at 1.0 for arrows, arc_progress for arcs
-        self.draw_vectors_on_ax(ax, f1, f2, r, scale, progress=min(1.0, arrow_progress), arc_progress=arc_progress)
-        self.canvas.draw()
-        
-        # Update progress using instance variable
-        self.animation_progress += self.animation_speed
-        
+        ax = self._anim_ax
+        max_val = self._anim_max_val
+        progress = min(1.0, arrow_progress)
+
+        # A resize invalidates the captured background; rebuild it from the
+        # static scene (animated artists are excluded from a full draw)
+        if self.canvas.get_width_height() != self._bg_size:
+            self.canvas.draw()
+            self._bg = self.canvas.copy_from_bbox(ax.bbox)
+            self._bg_size = self.canvas.get_width_height()
+
+        self.canvas.restore_region(self._bg)
+
+        # Mutate the persistent artists in place - no figure clear, no artist
+        # reconstruction, no full-canvas rasterization
+        for vec, color, name, width, highlight, handles in self._vec_artists:
+            draw_vector_with_labels(ax, 0, 0, vec.x * progress, vec.y * progress,
+                                   color, name, vec.mag, vec.angle,
+                                   vec.mag / scale, max_val,
+                                   width=width, highlight=highlight, artists=handles)
+
+        # Construction lines (only show when animation complete - consistent threshold)
+        if progress >= 1.0:
+            self._construction.set_segments(
+                [[(f1.x, f1.y), (f1.x + f2.x, f1.y + f2.y)],
+                 [(f2.x, f2.y), (f2.x + f1.x, f2.y + f1.y)]])
+        else:
+            self._construction.set_segments([])
+
+        # Angle arcs (only show after arrows complete, with gradual growth)
+        if arc_progress >= 1.0:
+            # Normalize by the 0.33 span so the sweep closes at exactly 1.0
+            arc_angle_progress = min(1.0, (arc_progress - 1.0) / 0.33)
+            for angle, color, ratio, highlight, handles in self._arc_artists:
+                if handles:
+                    draw_angle_arc(ax, angle * arc_angle_progress, color, max_val,
+                                  ratio, highlight=highlight, artists=handles)
+
+        for artist in self._iter_dynamic_artists():
+            ax.draw_artist(artist)
+        self.canvas.blit(ax.bbox)
+
         # Continue animation until both arrows and arcs are complete
-        if self.animation_progress < 1.33:  # 1.0 for arrows + 0.33 for arcs
-            self.animation_id = self.root.after(16, self.animate_step)  # ~60 FPS
+        self._frame_idx += 1
+        if self._frame_idx < len(self._arrow_frames):
+            self.animation_id = self.root.after(16, lambda: self.animate_step(seq))  # ~60 FPS
         else:
             self.animation_running = False
-            # Draw final frame with full vectors and arcs
-            self.figure.clear()
-            self.figure.set_facecolor(self.current_theme.background_color)
-            ax = self.figure.add_subplot(111, facecolor=self.current_theme.background_color)
-            self.draw_vectors_on_ax(ax, f1, f2, r, scale, progress=1.0, arc_progress=1.33)
+            # Final frame: settle every artist at its end state and hand the
+            # canvas one complete synchronous draw (exports and resizes rely
+            # on a full rasterization being current)
+            for vec, color, name, width, highlight, handles in self._vec_artists:
+                draw_vector_with_labels(ax, 0, 0, vec.x, vec.y, color, name,
+                                       vec.mag, vec.angle, vec.mag / scale, max_val,
+                                       width=width, highlight=highlight, artists=handles)
+            self._construction.set_segments(
+                [[(f1.x, f1.y), (f1.x + f2.x, f1.y + f2.y)],
+                 [(f2.x, f2.y), (f2.x + f1.x, f2.y + f1.y)]])
+            # Settle the arcs at their full, unscaled angles so the labels
+            # show the true values
+            for angle, color, ratio, highlight, handles in self._arc_artists:
+                if handles:
+                    draw_angle_arc(ax, angle, color, max_val,
+                                  ratio, highlight=highlight, artists=handles)
+            for artist in self._iter_dynamic_artists():
+                artist.set_animated(False)
             self.canvas.draw()
-        
+
     def display_result(self, r, scale):
         """Display calculation results."""
-        self.result_text.config(state=tk.NORMAL)
-        self.result_text.delete(1.0, tk.END)
-        
-        result = f"Magnitude: {r.mag:.2f} N\n"
-        result += f"Length: {r.mag/scale:.2f} cm\n"
-        result += f"Angle: {r.angle:.2f}°\n\n"
-        result += f"Components:\n"
-        result += f"  X: {r.x:.2f} N\n"
-        result += f"  Y: {r.y:.2f} N"
-        
-        self.result_text.insert(1.0, result)
-        self.result_text.config(state=tk.DISABLED)
+        self._error_var.set('')
+        result_key = (r.mag, r.angle, r.x, r.y, scale)
+        if result_key == self._last_result_key:
+            return
+        self._last_result_key = result_key
+        self._res_mag.set(f"{r.mag:.2f} N")
+        self._res_len.set(f"{r.mag/scale:.2f} cm")
+        self._res_ang.set(f"{r.angle:.2f}°")
+        self._res_x.set(f"{r.x:.2f} N")
+        self._res_y.set(f"{r.y:.2f} N")
     
     def update_solution_text(self, f1, f2, r, scale):
         """Update solution panel."""
-        from vector_addition import generate_solution_text
-        
         solution = generate_solution_text(f1, f2, r, scale)
-        
+        # Repeated Calculate with identical inputs is common; skip the text
+        # widget wipe/re-insert when nothing changed
+        if solution == self._last_solution:
+            return
+        self._last_solution = solution
+
         self.solution_text.config(state=tk.NORMAL)
         self.solution_text.delete(1.0, tk.END)
         self.solution_text.insert(1.0, solution)
@@ -702,17 +966,21 @@ class ModernVectorGUI:
         """Load calculation from history."""
         if 0 <= index < len(self.history.history):
             entry = self.history.history[index]
-            
-            # Update input fields
-            self.scale_var.set(str(entry['scale']))
-            self.f1_mag_var.set(str(entry['f1_mag']))
-            self.f1_angle_var.set(str(entry['f1_angle']))
-            self.f2_mag_var.set(str(entry['f2_mag']))
-            self.f2_angle_var.set(str(entry['f2_angle']))
-            
-            # Update sliders
-            self.f1_slider.set(entry['f1_angle'])
-            self.f2_slider.set(entry['f2_angle'])
+
+            # Update input fields and sliders. The values came out of a
+            # successful calculation, so mute the per-write trace/command
+            # callbacks for the burst of programmatic sets
+            self._loading_history = True
+            try:
+                self.scale_var.set(str(entry['scale']))
+                self.f1_mag_var.set(str(entry['f1_mag']))
+                self.f1_angle_var.set(str(entry['f1_angle']))
+                self.f2_mag_var.set(str(entry['f2_mag']))
+                self.f2_angle_var.set(str(entry['f2_angle']))
+                self.f1_slider.set(entry['f1_angle'])
+                self.f2_slider.set(entry['f2_angle'])
+            finally:
+                self._loading_history = False
             
             # Recalculate and display
             f1, f2, r = add_vectors(entry['f1_mag'], entry['f1_angle'], 
@@ -726,17 +994,22 @@ class ModernVectorGUI:
     
     def show_inline_error(self, message):
         """Show error inline instead of modal dialog."""
-        self.result_text.config(state=tk.NORMAL)
-        self.result_text.delete(1.0, tk.END)
-        self.result_text.insert(1.0, f"❌ Error:\n{message}")
-        self.result_text.config(state=tk.DISABLED, fg=self.COLORS['danger'])
-        
-        # Reset color after 3 seconds
-        self.root.after(3000, lambda: self.result_text.config(fg=self.COLORS['text_dark']))
+        self._error_var.set(f"❌ Error: {message}")
+
+        # Re-arm a single clear timer: without the cancel, a burst of
+        # errors would stack callbacks and the oldest one would wipe the
+        # newest message early
+        if self._err_reset_id is not None:
+            self.root.after_cancel(self._err_reset_id)
+        self._err_reset_id = self.root.after(3000, self._clear_inline_error)
+
+    def _clear_inline_error(self):
+        """Clear the inline error line after its display window."""
+        self._err_reset_id = None
+        self._error_var.set('')
     
     def export_plot(self, fmt):
         """Export plot with better filename suggestion."""
-        from datetime import datetime
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         default_name = f"vector_plot_{timestamp}.{fmt}"
         
@@ -746,51 +1019,105 @@ class ModernVectorGUI:
             filetypes=[(f"{fmt.upper()} files", f"*.{fmt}"), ("All files", "*.*")]
         )
         if filepath:
+            # For vector formats, rasterize the arrow/arc collections at the
+            # export dpi instead of serializing every arrowhead path; axes,
+            # grid and text stay as vector output so they remain crisp
+            rasterize = [c for c in self.ax.collections
+                         if not c.get_rasterized()] if fmt in ('pdf', 'svg') else []
+            for collection in rasterize:
+                collection.set_rasterized(True)
             try:
-                self.figure.savefig(filepath, format=fmt, dpi=300, bbox_inches='tight')
-                messagebox.showinfo("Success", f"Exported to {filepath}")
-            except Exception as e:
-                messagebox.showerror("Error", f"Export failed: {e}")
+                # Snapshot the figure by pickling it on the Tk thread (fast,
+                # tens of KB), then rasterize and write the 300 dpi export on
+                # the worker so the mainloop stays responsive. The clone gets
+                # its own Agg canvas, so the live TkAgg canvas is never
+                # touched off-thread.
+                payload = pickle.dumps(self.figure)
+            finally:
+                for collection in rasterize:
+                    collection.set_rasterized(False)
+            self._io_pool.submit(self._export_worker, payload, filepath, fmt)
+
+    def _export_worker(self, payload, filepath, fmt):
+        """Render and write an export on the I/O worker thread."""
+        try:
+            figure = pickle.loads(payload)
+            figure.savefig(filepath, format=fmt, dpi=300, bbox_inches='tight')
+            error = None
+        except Exception as e:
+            error = str(e)
+        # Marshal the result dialog back onto the Tk thread
+        self.root.after(0, lambda: self._export_done(filepath, error))
+
+    def _export_done(self, filepath, error):
+        """Report the outcome of a background export (Tk thread)."""
+        if error is None:
+            messagebox.showinfo("Success", f"Exported to {filepath}")
+        else:
+            messagebox.showerror("Error", f"Export failed: {error}")
     
+    # Theme factories, dispatched by combobox value; unknown names fall
+    # back to ocean. Constructed themes are cached per instance so
+    # toggling back and forth reuses the same ColorTheme objects.
+    _THEME_FACTORIES = {
+        'light': ColorTheme.light_theme,
+        'dark': ColorTheme.dark_theme,
+        'ocean': ColorTheme.ocean_theme,
+    }
+
     def change_theme(self, event=None):
         """Change color theme and apply it across the UI and plot."""
         theme_name = self.theme_var.get().lower()
-        if theme_name == "light":
-            self.current_theme = ColorTheme.light_theme()
-        elif theme_name == "dark":
-            self.current_theme = ColorTheme.dark_theme()
-        else:
-            self.current_theme = ColorTheme.ocean_theme()
+        if theme_name not in self._THEME_FACTORIES:
+            theme_name = 'ocean'
+        # Combobox events also fire on focus changes; re-selecting the
+        # active theme should not cost a widget restyle and full redraw
+        if theme_name == self._current_theme_name:
+            return
+        self._current_theme_name = theme_name
+        theme = self._theme_cache.get(theme_name)
+        if theme is None:
+            theme = self._theme_cache[theme_name] = self._THEME_FACTORIES[theme_name]()
+        self.current_theme = theme
         self.apply_theme()
 
     def apply_theme(self):
         """Apply the current theme to widgets and re-render the plot."""
-        # Update text areas to match theme
-        try:
-            self.solution_text.config(bg=self.current_theme.solution_box_color,
-                                      fg=self.current_theme.text_color)
-        except Exception:
-            pass
-        try:
-            self.result_text.config(bg=self.current_theme.solution_box_color,
-                                    fg=self.current_theme.text_color)
-        except Exception:
-            pass
-        
-        # Redraw plot with the latest values if available
+        # Update text areas to match theme. Attribute guards instead of
+        # try/except: the widgets only miss if a theme change fires before
+        # the panels are built, and a probe is cheaper than an exception
+        solution_text = getattr(self, 'solution_text', None)
+        if solution_text is not None:
+            solution_text.config(bg=self.current_theme.solution_box_color,
+                                 fg=self.current_theme.text_color)
+        result_frame = getattr(self, '_result_frame', None)
+        if result_frame is not None:
+            result_frame.config(bg=self.current_theme.solution_box_color)
+            for label in self._result_labels:
+                label.config(bg=self.current_theme.solution_box_color)
+                if label is not self._error_label:
+                    label.config(fg=self.current_theme.text_color)
+
+        # Redraw plot with the latest values if available; entries come
+        # from successful calculations, so no defensive except is needed
         last = self.history.get_last(1)
         if last:
             entry = last[0]
-            try:
-                from vector_addition import add_vectors
-                f1, f2, r = add_vectors(entry['f1_mag'], entry['f1_angle'], entry['f2_mag'], entry['f2_angle'])
-                scale = entry['scale']
-                self.figure.clear()
-                self.figure.set_facecolor(self.current_theme.background_color)
-                ax = self.figure.add_subplot(111, facecolor=self.current_theme.background_color)
-                self.draw_vectors_on_ax(ax, f1, f2, r, scale)
-            except Exception:
-                pass
+            f1, f2, r = add_vectors(entry['f1_mag'], entry['f1_angle'],
+                                    entry['f2_mag'], entry['f2_angle'])
+            scale = entry['scale']
+            # Clearing the axes detaches the blitted artists and stales the
+            # captured background, so stop any in-flight animation first
+            self._anim_seq += 1
+            if self.animation_id:
+                self.root.after_cancel(self.animation_id)
+                self.animation_id = None
+            self.animation_running = False
+            self._bg = None
+            self.ax.clear()
+            self.figure.set_facecolor(self.current_theme.background_color)
+            self.ax.set_facecolor(self.current_theme.background_color)
+            self.draw_vectors_on_ax(self.ax, f1, f2, r, scale)
         self.canvas.draw_idle()
 
 